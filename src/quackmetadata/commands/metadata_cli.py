@@ -104,11 +104,21 @@ def metadata_cli(
     default=3,
     help="Number of retries for LLM calls",
 )
+@click.option(
+    "--model",
+    help="LLM model to use for extraction (defaults to the provider's model)",
+    type=str,
+)
 @click.option(
     "--dry-run",
     is_flag=True,
     help="Don't upload metadata to Google Drive, just extract and print",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always call the LLM, ignoring previously cached metadata",
+)
 @click.option(
     "--verbose",
     is_flag=True,
@@ -122,7 +132,9 @@ def extract_command(
     output: str | None,
     prompt_template: str | None,
     retries: int,
+    model: str | None,
     dry_run: bool,
+    no_cache: bool,
     verbose: bool,
 ) -> None:
     """
@@ -148,7 +160,9 @@ def extract_command(
     # Process optional prompt template file using quackcore.fs
     options: dict[str, object] = {
         "retries": retries,
+        "llm_model": model,
         "dry_run": dry_run,
+        "cache": "off" if no_cache else "exact",
         "verbose": verbose,
     }
     if prompt_template:
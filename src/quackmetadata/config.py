@@ -57,6 +57,20 @@ class QuackMetadataConfig(BaseModel):
         le=10,
     )
 
+    max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of files processed concurrently",
+        ge=1,
+        le=64,
+    )
+
+    max_llm_calls: int = Field(
+        default=10,
+        description="Maximum number of LLM requests in flight across the process",
+        ge=1,
+        le=64,
+    )
+
     output_format: str = Field(
         default="json",
         description="Default output format for metadata",
@@ -1,5 +1,6 @@
 import os
 import tempfile
+import time
 from logging import Logger
 from typing import Any, cast
 
@@ -51,7 +52,6 @@ def _check_other_instances() -> tuple[bool, str]:
         if info.success and info.exists:
             stats = getattr(info, "stats", None)
             if stats and hasattr(stats, "st_mtime"):
-                import time
                 if time.time() - stats.st_mtime < 600:
                     read = fs.read_text(_LOCK_FILE, encoding="utf-8")
                     if read.success:
@@ -166,6 +166,35 @@ class QuackMetadataPlugin(QuackToolPluginProtocol):
             self.logger.error(f"Processing error: {e}")
             return IntegrationResult.error_result(f"Processing error: {e}")
 
+    def process_files(
+        self,
+        file_paths: list[str],
+        output_paths: list[str | None] | None = None,
+        options: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> list[IntegrationResult]:
+        if not self._initialized:
+            init = self.initialize()
+            if not init.success:
+                return [init] * len(file_paths)
+        try:
+            self.logger.info(f"Processing {len(file_paths)} files")
+            return self._metadata_plugin.process_files(
+                file_paths=file_paths,
+                output_paths=output_paths,
+                options=options,
+                max_workers=max_workers,
+            )
+        except Exception as e:
+            self.logger.error(f"Processing error: {e}")
+            error = IntegrationResult.error_result(f"Processing error: {e}")
+            return [error] * len(file_paths)
+
+    def wait_uploads(self, timeout: float | None = None) -> list[IntegrationResult]:
+        if self._metadata_plugin is None:
+            return []
+        return self._metadata_plugin.wait_uploads(timeout=timeout)
+
     def __del__(self) -> None:
         try:
             info = fs.get_file_info(_LOCK_FILE)
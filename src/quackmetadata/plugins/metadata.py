@@ -7,17 +7,33 @@ to download files from Google Drive, extract metadata using LLMs, and upload
 results back to Google Drive.
 """
 
+import asyncio
+import atexit
+import codecs
+import hashlib
+import json
+import mmap
+import os
+import random
+import re
+import shutil
+import stat
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cached_property, lru_cache
+from itertools import repeat
 from logging import Logger
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
+from pydantic import ValidationError
+from quackcore.config import load_config
 from quackcore.errors import QuackIntegrationError
 
 # Use QuackCore FS for all file operations.
-from quackcore.fs.service import get_service
+from quackcore.fs.service import get_service, standalone
 from quackcore.integrations.core.results import IntegrationResult
-from quackcore.integrations.google.drive import GoogleDriveService
 from quackcore.integrations.llms import (
     ChatMessage,
     LLMOptions,
@@ -31,12 +47,548 @@ from quackcore.logging import get_logger
 from quackcore.paths import service as paths
 from quackcore.plugins.protocols import QuackPluginMetadata
 
+from quackmetadata.config import QuackMetadataConfig, get_tool_config
 from quackmetadata.protocols import QuackToolPluginProtocol
-from quackmetadata.schemas.metadata import Metadata
-from quackmetadata.utils.prompt_engine import get_template_path, render_prompt
+from quackmetadata.schemas.metadata import METADATA_LIST_ADAPTER, Metadata
+from quackmetadata.utils.cache import DriveDownloadCache, MetadataCache
+from quackmetadata.utils.prompt_engine import get_template_path, render_prompt_parts
 from quackmetadata.utils.rarity import calculate_rarity
+from quackmetadata.utils.truncation import (
+    DEFAULT_MAX_INPUT_TOKENS,
+    count_tokens,
+    truncate_content,
+)
+
+if TYPE_CHECKING:
+    # The Google API client stack is only loaded when Drive is first used.
+    from quackcore.integrations.google.drive import GoogleDriveService
 
 fs = get_service()
+logger = get_logger(__name__)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve GoogleDriveService on demand for code that imports it from here.
+
+    The class is stored as a module global once loaded, and the plugin looks
+    it up there, so patching this module's GoogleDriveService still works.
+    """
+    if name == "GoogleDriveService":
+        from quackcore.integrations.google.drive import GoogleDriveService
+
+        globals()["GoogleDriveService"] = GoogleDriveService
+        return GoogleDriveService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Matches a JSON object or array inside a ```json or bare ``` fence in one pass.
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+# Upper bound on the length of the LLM's metadata response.
+_MAX_RESPONSE_TOKENS = 2000
+
+# Rough token cost of the row delimiters around each document in a batch prompt.
+_BATCH_ROW_OVERHEAD_TOKENS = 16
+
+# Default ceiling on the response length of a batched request. Many models
+# can't produce _MAX_RESPONSE_TOKENS for every document of a large batch.
+_DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+def _order_batch_rows(items: Any, count: int) -> list[dict[str, Any]]:
+    """
+    Put the results of a batched request in document order.
+
+    Each result must carry the "row" number of its document, and the rows
+    must be exactly 1 to count, so a result is never attributed to the
+    wrong document.
+
+    Args:
+        items: The "results" array of the batch response.
+        count: Number of documents in the batch.
+
+    Returns:
+        The results sorted by row.
+
+    Raises:
+        ValueError: If the rows don't match the documents one to one.
+    """
+    if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+        raise ValueError("batch results are not a list of objects")
+    rows = [item.get("row") for item in items]
+    # type() rather than isinstance(), since bools are ints too.
+    if not all(type(row) is int for row in rows) or sorted(rows) != list(
+        range(1, count + 1)
+    ):
+        raise ValueError(f"batch results have rows {rows} for {count} documents")
+    return sorted(items, key=lambda item: item["row"])
+
+
+# Sent with a response that isn't syntactically valid JSON. Repairing the
+# syntax doesn't need the document, so the retry only carries the response.
+_FIXUP_REQUEST = (
+    "The following response is not valid JSON matching the Metadata schema "
+    "({error}). Return ONLY a corrected JSON object, no prose:\n\n{response}"
+)
+
+# Sent after the original prompt and the bad response when the JSON parsed but
+# didn't match the schema. Filling in missing or invalid fields needs the
+# document, otherwise the model can only invent them.
+_FIXUP_WITH_DOCUMENT_REQUEST = (
+    "Your response does not match the Metadata schema ({error}). Using the "
+    "document above, return ONLY a corrected JSON object, no prose."
+)
+
+
+@lru_cache(maxsize=1)
+def _get_fixup_system_prompt() -> str:
+    """
+    Build the system prompt for JSON fix-up retries.
+
+    Returns:
+        Instructions containing the Metadata JSON schema.
+    """
+    schema = json.dumps(Metadata.model_json_schema(), ensure_ascii=False)
+    return (
+        "You repair JSON documents. Reply with a single JSON object that "
+        "conforms to this JSON schema, with no markdown or additional text:\n"
+        f"{schema}"
+    )
+
+
+def _describe_parse_error(error: Exception) -> str:
+    """
+    Summarize why a response couldn't be parsed, for the fix-up prompt.
+
+    Args:
+        error: Exception raised while parsing or validating the response.
+
+    Returns:
+        One line per validation error, without the echoed input, or the
+        message of any other exception.
+    """
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(map(str, err['loc'])) or 'response'}: {err['msg']}"
+            for err in error.errors(include_url=False, include_input=False)
+        )
+    return str(error)
+
+
+def _is_json_syntax_error(error: Exception) -> bool:
+    """
+    Check whether a response failed to parse as JSON at all.
+
+    Args:
+        error: Exception raised while parsing or validating the response.
+
+    Returns:
+        True if the response isn't valid JSON, False if it parsed but didn't
+        match the schema.
+    """
+    if isinstance(error, json.JSONDecodeError):
+        return True
+    if isinstance(error, ValidationError):
+        return all(err["type"] == "json_invalid" for err in error.errors())
+    return False
+
+
+# Retry delays grow exponentially from the base and are capped at the maximum.
+_BACKOFF_BASE_SECONDS = 0.25
+_BACKOFF_MAX_SECONDS = 8.0
+
+# Rate-limited requests back off harder, since retrying early only fails again.
+_RATE_LIMIT_BACKOFF_BASE_SECONDS = 1.0
+_RATE_LIMIT_BACKOFF_MAX_SECONDS = 30.0
+
+# A malformed response isn't a load problem, so its fix-up retry waits briefly.
+_PARSE_BACKOFF_SECONDS = 0.1
+
+# Finds a server-provided "Retry-After" delay in an error message. Only bare
+# numbers and values in seconds match, so "retry after 2 minutes" is ignored.
+_RETRY_AFTER = re.compile(
+    r"retry[- _]after\D{0,3}(\d+(?:\.\d+)?)(?!\.?\d)"
+    r"(?:\s*s(?:ec(?:ond)?s?)?\b|(?!\s*[a-z]))",
+    re.IGNORECASE,
+)
+
+# Recognizes rate-limit and quota errors in an error message.
+_RATE_LIMITED = re.compile(
+    r"\b429\b|rate.?limit|too many requests|quota", re.IGNORECASE
+)
+
+
+def _compute_backoff(attempt: int, error: object | None = None) -> float:
+    """
+    Compute how long to wait before the next LLM attempt.
+
+    Uses capped exponential backoff with jitter, scaled by the kind of
+    failure: rate limits wait longest, other request errors use the default
+    schedule, and unparseable responses (no error) retry almost immediately.
+    A Retry-After value in the error message takes precedence when present,
+    capped at the rate-limit maximum so a worker is never parked for long.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed.
+        error: The error reported for the failed attempt, or None if the
+            response arrived but couldn't be parsed.
+
+    Returns:
+        The delay in seconds.
+    """
+    if error is None:
+        return _PARSE_BACKOFF_SECONDS + random.uniform(0, _PARSE_BACKOFF_SECONDS)
+
+    message = str(error)
+    match = _RETRY_AFTER.search(message)
+    if match:
+        return min(float(match.group(1)), _RATE_LIMIT_BACKOFF_MAX_SECONDS)
+    if _RATE_LIMITED.search(message):
+        base, cap = _RATE_LIMIT_BACKOFF_BASE_SECONDS, _RATE_LIMIT_BACKOFF_MAX_SECONDS
+    else:
+        base, cap = _BACKOFF_BASE_SECONDS, _BACKOFF_MAX_SECONDS
+    return min(cap, base * (2**attempt)) + random.uniform(0, base)
+
+
+# Metadata card layout; the precision in each field spec truncates long values.
+_CARD_TEMPLATE = (
+    "╔══════════════════════════════════════════╗\n"
+    "║            🃏 METADATA CARD              ║\n"
+    "╠══════════════════════════════════════════╣\n"
+    "║ Title: {title:<30.30}║\n"
+    "║ Domain: {domain:<28.28}║\n"
+    "║ Tone: {tone:<31.31}║\n"
+    "║ Rarity: {rarity:<29.29}║\n"
+    "{mock_block}"
+    "╚══════════════════════════════════════════╝"
+)
+_MOCK_CARD_BLOCK = (
+    "╠══════════════════════════════════════════╣\n"
+    "║ ⚠️ USING MOCK LLM - DATA IS SIMULATED ⚠️  ║\n"
+)
+
+# Google Drive allows roughly 10 requests per second per user.
+_DRIVE_REQUESTS_PER_SECOND = 10.0
+
+
+class _RateLimiter:
+    """Thread-safe limiter that spaces calls evenly to stay under a quota."""
+
+    def __init__(self, calls_per_second: float) -> None:
+        self._interval = 1.0 / calls_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Shared by all plugin instances, since the Drive quota is per user.
+_drive_rate_limiter = _RateLimiter(_DRIVE_REQUESTS_PER_SECOND)
+
+# Used when neither the options nor the configuration set a concurrency.
+_DEFAULT_CONCURRENCY = 8
+
+# Used when the configuration doesn't set max_llm_calls.
+_DEFAULT_MAX_LLM_CALLS = 10
+
+
+@lru_cache(maxsize=8)
+def _get_configured_limit(name: str, default: int) -> int:
+    """
+    Read an integer limit from the QuackMetadata configuration once per process.
+
+    Args:
+        name: Name of the QuackMetadataConfig field.
+        default: Value used when the field is missing or invalid.
+
+    Returns:
+        The configured value, validated against QuackMetadataConfig.
+    """
+    try:
+        tool_config = get_tool_config()
+    except Exception as e:
+        logger.warning(f"Failed to load configuration, using default {name}: {e}")
+        return default
+
+    value = (
+        tool_config.get(name)
+        if isinstance(tool_config, dict)
+        else getattr(tool_config, name, None)
+    )
+    if value is None:
+        logger.debug(f"No {name} configured, using default: {default}")
+        return default
+    try:
+        return getattr(QuackMetadataConfig.model_validate({name: value}), name)
+    except ValidationError as e:
+        logger.warning(f"Invalid {name} setting, using default: {e}")
+        return default
+
+
+def _get_default_concurrency() -> int:
+    """
+    Get the configured number of files to process concurrently.
+
+    Returns:
+        The max_concurrency setting.
+    """
+    return _get_configured_limit("max_concurrency", _DEFAULT_CONCURRENCY)
+
+
+# Caps in-flight LLM requests across all plugin instances and worker threads,
+# so a large process_files batch doesn't trip the provider's rate limits. It
+# is sized from max_llm_calls on first use.
+_llm_call_slots: threading.BoundedSemaphore | None = None
+_llm_call_slots_lock = threading.Lock()
+
+
+def _get_llm_call_slots() -> threading.BoundedSemaphore:
+    """
+    Get the process-wide semaphore limiting concurrent LLM requests.
+
+    Returns:
+        A semaphore with max_llm_calls slots.
+    """
+    global _llm_call_slots
+    with _llm_call_slots_lock:
+        if _llm_call_slots is None:
+            _llm_call_slots = threading.BoundedSemaphore(
+                _get_configured_limit("max_llm_calls", _DEFAULT_MAX_LLM_CALLS)
+            )
+        return _llm_call_slots
+
+
+@lru_cache(maxsize=1)
+def _get_configured_llm() -> tuple[str | None, str | None]:
+    """
+    Read the default LLM provider and its default model from the configuration.
+
+    Returns:
+        A tuple of (provider, model), with None for values that aren't set.
+    """
+    try:
+        llm_config = load_config().integrations.llm
+    except Exception:
+        return None, None
+    if isinstance(llm_config, dict):
+        provider = llm_config.get("default_provider")
+        provider_config = llm_config.get(provider or "", {})
+    else:
+        provider = getattr(llm_config, "default_provider", None)
+        provider_config = getattr(llm_config, provider or "", None) or {}
+    if isinstance(provider_config, dict):
+        model = provider_config.get("default_model")
+    else:
+        model = getattr(provider_config, "default_model", None)
+    return provider, model
+
+
+@lru_cache(maxsize=1)
+def _get_temp_root() -> str:
+    """
+    Create the process-wide temp directory that holds each plugin's scratch space.
+
+    The directory is removed when the process exits, so scratch files don't
+    accumulate in the system temp directory.
+
+    Returns:
+        The temp root path.
+    """
+    temp_result = fs.create_temp_directory(prefix="quackmetadata_")
+    if temp_result.success:
+        temp_root = str(temp_result.path)
+    else:
+        # Fallback to using tempfile if FS operation fails.
+        temp_root = tempfile.mkdtemp(prefix="quackmetadata_")
+    atexit.register(shutil.rmtree, temp_root, ignore_errors=True)
+    return temp_root
+
+
+@lru_cache(maxsize=1)
+def _get_default_output_dir() -> str:
+    """
+    Resolve the default output directory once per process.
+
+    Uses the project context's output directory when one is defined, and
+    "./output" otherwise.
+
+    Returns:
+        The output directory path.
+    """
+    try:
+        project_context = paths.detect_project_context()
+        output_dir = project_context.get_output_dir()
+        if output_dir:
+            return str(output_dir)
+    except Exception:
+        pass
+    return str(fs.normalize_path("./output"))
+
+
+# Files larger than this are rejected instead of being read into memory.
+_MAX_FILE_BYTES = 50 * 1024 * 1024
+_READ_CHUNK_SIZE = 64 * 1024
+# Reads of at least this many bytes go through mmap, so the file is decoded
+# straight from the page cache instead of being copied into chunks first.
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _read_and_hash(path: str, max_bytes: int | None = None) -> tuple[str, str]:
+    """
+    Read a UTF-8 text file and hash its bytes in a single pass.
+
+    Args:
+        path: Path to the file.
+        max_bytes: Read at most this many bytes from the start of the file.
+            Files of any size may be read when set.
+
+    Returns:
+        A tuple of (content, hex SHA-256 digest of the bytes read). Invalid
+        UTF-8 sequences are replaced rather than failing the read.
+
+    Raises:
+        ValueError: If the file is larger than _MAX_FILE_BYTES and no
+            max_bytes is given.
+        OSError: If the file can't be read.
+    """
+    digest = hashlib.sha256()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    chunks: list[str] = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if max_bytes is None:
+            if size > _MAX_FILE_BYTES:
+                raise ValueError(
+                    f"File is too large ({size} bytes, limit {_MAX_FILE_BYTES})"
+                )
+            remaining = size
+        else:
+            remaining = min(size, max_bytes)
+        truncated = remaining < size
+        if remaining >= _MMAP_THRESHOLD:
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                memoryview(mm) as view,
+                view[:remaining] as data,
+            ):
+                digest.update(data)
+                # Decode from the mapped buffer directly; the incremental
+                # decoder would first copy it into a bytes object. A character
+                # cut off by max_bytes is dropped rather than replaced.
+                content = codecs.utf_8_decode(data, "replace", not truncated)[0]
+            return content, digest.hexdigest()
+        while remaining > 0 and (
+            chunk := f.read(min(_READ_CHUNK_SIZE, remaining))
+        ):
+            remaining -= len(chunk)
+            digest.update(chunk)
+            chunks.append(decoder.decode(chunk))
+    # A character cut off by max_bytes is dropped rather than replaced.
+    chunks.append(decoder.decode(b"", final=not truncated))
+    return "".join(chunks), digest.hexdigest()
+
+
+def _file_md5(path: str) -> str:
+    """
+    Compute the MD5 digest of a file, as reported in Drive's md5Checksum.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The hex MD5 digest of the file's bytes.
+
+    Raises:
+        OSError: If the file can't be read.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _normalized_content_hash(content: str) -> str:
+    """
+    Hash a text with all whitespace runs collapsed to single spaces.
+
+    Args:
+        content: Text to hash.
+
+    Returns:
+        A hex SHA-256 digest of the normalized text.
+    """
+    normalized = " ".join(content.split())
+    return hashlib.sha256(normalized.encode("utf-8", errors="replace")).hexdigest()
+
+
+def _template_fingerprint(template_path: str) -> str:
+    """
+    Identify a template version for cache keys without reading it.
+
+    Args:
+        template_path: Path to the prompt template.
+
+    Returns:
+        The path combined with the file's modification time and size.
+    """
+    try:
+        st = os.stat(template_path)
+    except OSError:
+        return template_path
+    return f"{template_path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+# Google Drive file IDs are 25-45 URL-safe base64 characters.
+_DRIVE_ID = re.compile(r"[A-Za-z0-9_-]{25,45}")
+
+
+def _looks_like_drive_id(path: str) -> bool:
+    """
+    Check whether a path string has the shape of a Google Drive file ID.
+
+    Args:
+        path: Path string to check.
+
+    Returns:
+        True if the string could be a Drive file ID.
+    """
+    # The length gate rejects most local paths without running the regex.
+    return 25 <= len(path) <= 45 and _DRIVE_ID.fullmatch(path) is not None
+
+
+def _clean_path(path: Any) -> str:
+    """
+    Convert a path-like value to a plain path string.
+
+    Plain strings, the common case, are returned as-is; PathResults and their
+    string representations go through QuackCore's extraction.
+
+    Args:
+        path: A string, Path, or PathResult.
+
+    Returns:
+        The path as a string.
+
+    Raises:
+        ValueError: If no path could be extracted.
+    """
+    if type(path) is str and not path.startswith("success="):
+        return path
+
+    extract_result = standalone.extract_path_from_result(path)
+    if not extract_result.success:
+        raise ValueError(extract_result.error)
+    return str(extract_result.data)
 
 
 # Define the SupportsWrite protocol.
@@ -61,48 +613,106 @@ class MetadataPlugin(QuackToolPluginProtocol):
       4. Upload the results back to Google Drive
     """
 
+    # Environment setup is process-wide, so it only has to succeed once.
+    _environment_initialized: ClassVar[bool] = False
+
+    # The LLM service is shared by all instances, so creating another plugin
+    # doesn't re-read the config or re-initialize the provider client.
+    _shared_llm_service: ClassVar[tuple[Any, bool] | None] = None
+    _llm_service_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize the metadata plugin."""
         self._logger: Logger = get_logger(__name__)
-        self._drive_service = None
+        self._drive_service: "GoogleDriveService | None" = None
+        self._drive_lock = threading.Lock()
         self._llm_service = None
         self._initialized: bool = False
         self._using_mock: bool = False
-
-        # Create a temporary directory using QuackCore FS.
-        temp_result = fs.create_temp_directory(prefix="quackmetadata_")
-        if temp_result.success:
-            self._temp_dir: str = str(temp_result.path)
-        else:
-            # Fallback to using tempfile if FS operation fails.
-            self._temp_dir = tempfile.mkdtemp(prefix="quackmetadata_")
-
+        self._cache = MetadataCache()
+        self._download_cache = DriveDownloadCache()
+        self._pending_uploads: list[Future] = []
+        self._uploads_lock = threading.Lock()
+
+    @cached_property
+    def _temp_dir(self) -> str:
+        """Scratch directory for Drive downloads, created on first use."""
+        return tempfile.mkdtemp(prefix="plugin_", dir=_get_temp_root())
+
+    @cached_property
+    def _output_dir(self) -> str:
+        """Default directory for metadata files, created on first use."""
         # Instead of hard-coding "./output", resolve the output directory using QuackCore Paths.
-        try:
-            project_context = paths.detect_project_context()
-            # If a project context exists, use its defined output directory.
-            output_dir = (
-                project_context.get_output_dir()
-                if project_context.get_output_dir()
-                else fs.normalize_path("./output")
-            )
-        except Exception:
-            output_dir = fs.normalize_path("./output")
+        output_dir = _get_default_output_dir()
 
         dir_result = fs.create_directory(output_dir, exist_ok=True)
         if dir_result.success:
-            self._output_dir = str(dir_result.path)
-        else:
-            self._logger.warning(
-                f"Failed to create output directory: {dir_result.error}"
-            )
-            self._output_dir = "./output"
+            return str(dir_result.path)
+        self._logger.warning(f"Failed to create output directory: {dir_result.error}")
+        return "./output"
+
+    @cached_property
+    def _upload_executor(self) -> ThreadPoolExecutor:
+        """Worker pool for background Drive uploads, created on first use."""
+        return ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="quackmetadata-upload"
+        )
+
+    @cached_property
+    def _llm_identity(self) -> tuple[str, str]:
+        """
+        Provider and default model actually used for LLM calls.
+
+        Taken from the initialized integration where it exposes them, and
+        from the configuration otherwise, so cached results from one
+        provider or model are never served for another.
+        """
+        service = self._llm_service
+        client = getattr(service, "client", None)
+        configured_provider, configured_model = _get_configured_llm()
+        provider = (
+            getattr(service, "successful_provider", None)
+            or getattr(service, "provider", None)
+            or configured_provider
+        )
+        model = (
+            getattr(client, "model", None)
+            or getattr(service, "model", None)
+            or configured_model
+        )
+        # The client class also tells providers apart when neither is exposed.
+        return (
+            f"{provider}:{type(client or service).__name__}",
+            str(model or "default"),
+        )
 
     @property
     def logger(self) -> Logger:
         """Get the logger for the plugin."""
         return self._logger
 
+    @property
+    def drive_service(self) -> "GoogleDriveService":
+        """
+        Get the Google Drive service, initializing it on first access.
+
+        Raises:
+            QuackIntegrationError: If Google Drive can't be initialized.
+        """
+        with self._drive_lock:
+            if self._drive_service is None:
+                service_class = globals().get("GoogleDriveService") or __getattr__(
+                    "GoogleDriveService"
+                )
+                drive_service = service_class()
+                drive_result = drive_service.initialize()
+                if not drive_result.success:
+                    raise QuackIntegrationError(
+                        f"Failed to initialize Google Drive: {drive_result.error}"
+                    )
+                self._drive_service = drive_service
+            return self._drive_service
+
     @property
     def name(self) -> str:
         """Get the name of the plugin."""
@@ -152,16 +762,47 @@ class MetadataPlugin(QuackToolPluginProtocol):
         try:
             self._initialize_environment()
 
-            self._drive_service = GoogleDriveService()
-            drive_result = self._drive_service.initialize()
-            if not drive_result.success:
-                return IntegrationResult.error_result(
-                    f"Failed to initialize Google Drive: {drive_result.error}"
+            # Google Drive is initialized on first use (see drive_service), so
+            # runs that only touch local files never authenticate with Drive.
+            self._llm_service, self._using_mock = self._get_llm_service()
+
+            self._initialized = True
+
+            if self._using_mock:
+                return IntegrationResult.success_result(
+                    message=(
+                        "MetadataPlugin initialized with MockLLMClient. "
+                        "Note: Results will be simulated, not real metadata extraction."
+                    )
+                )
+            else:
+                return IntegrationResult.success_result(
+                    message="MetadataPlugin initialized successfully"
                 )
+        except Exception as e:
+            self.logger.exception("Failed to initialize MetadataPlugin")
+            return IntegrationResult.error_result(
+                f"Failed to initialize MetadataPlugin: {str(e)}"
+            )
+
+    def _get_llm_service(self) -> tuple[Any, bool]:
+        """
+        Get the process-wide LLM service, initializing it on first use.
+
+        Only a service that initialized successfully is shared. The mock
+        fallback is not, so a later plugin retries the real service, e.g.
+        once an API key has been configured.
+
+        Returns:
+            A tuple of the LLM service and whether it is a MockLLMClient.
+        """
+        with MetadataPlugin._llm_service_lock:
+            if MetadataPlugin._shared_llm_service is not None:
+                return MetadataPlugin._shared_llm_service
 
             try:
-                self._llm_service = create_integration()
-                llm_result = self._llm_service.initialize()
+                llm_service = create_integration()
+                llm_result = llm_service.initialize()
                 if not llm_result.success:
                     error_message = (
                         f"Failed to initialize LLM service: {llm_result.error}"
@@ -169,6 +810,8 @@ class MetadataPlugin(QuackToolPluginProtocol):
                     if "API key not provided" in str(llm_result.error):
                         error_message += "\nPlease ensure your API key is properly configured in quack_config.yaml or as an environment variable."
                     raise QuackIntegrationError(error_message)
+                MetadataPlugin._shared_llm_service = (llm_service, False)
+                return MetadataPlugin._shared_llm_service
             except QuackIntegrationError as e:
                 if "API key not provided" in str(e):
                     self.logger.error(
@@ -177,36 +820,32 @@ class MetadataPlugin(QuackToolPluginProtocol):
                 self.logger.warning(
                     "Falling back to MockLLMClient for development/testing"
                 )
-                self._llm_service = MockLLMClient()
-                self._using_mock = True
+                return MockLLMClient(), True
 
-            self._initialized = True
+    @classmethod
+    def reset_llm_service(cls) -> None:
+        """
+        Drop the shared LLM service.
 
-            if self._using_mock:
-                return IntegrationResult.success_result(
-                    message=(
-                        "MetadataPlugin initialized with MockLLMClient. "
-                        "Note: Results will be simulated, not real metadata extraction."
-                    )
-                )
-            else:
-                return IntegrationResult.success_result(
-                    message="MetadataPlugin initialized successfully"
-                )
-        except Exception as e:
-            self.logger.exception("Failed to initialize MetadataPlugin")
-            return IntegrationResult.error_result(
-                f"Failed to initialize MetadataPlugin: {str(e)}"
-            )
+        Plugins initialized afterwards create a new one, e.g. after the API
+        keys or the LLM configuration have changed.
+        """
+        with cls._llm_service_lock:
+            cls._shared_llm_service = None
 
     def _initialize_environment(self) -> None:
         """
         Initialize environment variables from configuration.
+
+        Runs once per process; later plugin instances skip it.
         """
+        if MetadataPlugin._environment_initialized:
+            return
         try:
             from quackmetadata import initialize
 
             initialize()
+            MetadataPlugin._environment_initialized = True
         except Exception as e:
             self.logger.warning(f"Failed to initialize environment: {e}")
 
@@ -246,110 +885,588 @@ class MetadataPlugin(QuackToolPluginProtocol):
             )
 
         try:
-            # Import extract_path_from_result
-            from quackcore.fs.service import standalone
-
-            # Get the extracted path result
-            extract_result = standalone.extract_path_from_result(file_path)
-            if not extract_result.success:
-                return IntegrationResult.error_result(
-                    f"Failed to process path: {extract_result.error}")
-
-            # Get the actual string path from the result
-            clean_file_path = extract_result.data
-
-            # Get file info using the clean path
-            file_info = fs.get_file_info(clean_file_path)
-
-            # Determine if it's a Drive ID or local path
-            is_drive_id = (not file_info.success or not file_info.exists) and (
-                    "/" not in str(clean_file_path) and "\\" not in str(clean_file_path)
-            )
+            try:
+                clean_file_path = _clean_path(file_path)
+            except ValueError as e:
+                return IntegrationResult.error_result(f"Failed to process path: {e}")
+
+            # Treat it as a Drive ID only if it has the right shape and isn't
+            # an existing local file. Other paths skip the probe entirely;
+            # _process_local_file reports missing files itself.
+            is_drive_id = False
+            file_info = None
+            if _looks_like_drive_id(clean_file_path):
+                file_info = fs.get_file_info(clean_file_path)
+                is_drive_id = not file_info.success or not file_info.exists
 
             # Clean output path if provided
             clean_output_path = None
             if output_path:
-                output_extract_result = standalone.extract_path_from_result(output_path)
-                if output_extract_result.success:
-                    clean_output_path = output_extract_result.data
+                try:
+                    clean_output_path = _clean_path(output_path)
+                except ValueError:
+                    pass
 
             if is_drive_id:
                 return self._process_drive_file(clean_file_path, clean_output_path,
                                                 options)
             else:
                 return self._process_local_file(clean_file_path, clean_output_path,
-                                                options)
+                                                options, file_info=file_info)
         except Exception as e:
             self.logger.exception(f"Failed to process file: {e}")
             return IntegrationResult.error_result(f"Failed to process file: {str(e)}")
 
-    def _process_drive_file(
-        self, file_id: str, output_path: str | None, options: dict[str, Any]
-    ) -> IntegrationResult:
+    def process_files(
+        self,
+        file_paths: list[str],
+        output_paths: list[str | None] | None = None,
+        options: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> list[IntegrationResult]:
         """
-        Process a file from Google Drive.
+        Process several files concurrently.
+
+        Each file goes through process_file on a worker thread, so the Drive
+        and LLM round-trips of different files overlap.
 
         Args:
-            file_id: Google Drive file ID.
-            output_path: Optional path for the output metadata file.
-            options: Processing options.
+            file_paths: Paths to the files to process (local paths or Google Drive IDs).
+            output_paths: Optional output paths, one per file.
+            options: Optional processing options shared by all files. The
+                "concurrency" option sets the number of workers (default: the
+                configured max_concurrency), and "batch_size" sends up to that
+                many local files to the LLM in a single request (default: 1,
+                no batching). Batching needs a batch template, so a custom
+                "prompt_template" without a "batch_prompt_template" processes
+                files one by one. "max_output_tokens" caps the response length
+                of a batched request (default: 4096).
+            max_workers: Number of worker threads; overrides the "concurrency"
+                option when given.
 
         Returns:
-            IntegrationResult containing the metadata extraction result.
+            A list of IntegrationResults in the same order as file_paths.
         """
-        self.logger.info(f"Downloading file from Google Drive with ID: {file_id}")
-
-        # Download the file to the temporary directory (convert to string if necessary)
-        temp_dir_str = str(self._temp_dir)
-        download_result = self._drive_service.download_file(
-            remote_id=file_id, local_path=temp_dir_str
-        )
-        if not download_result.success:
-            return IntegrationResult.error_result(
-                f"Failed to download file from Google Drive: {download_result.error}"
+        if output_paths is None:
+            output_paths = [None] * len(file_paths)
+        if len(output_paths) != len(file_paths):
+            error = IntegrationResult.error_result(
+                "output_paths must have the same length as file_paths"
             )
+            return [error] * len(file_paths)
 
-        local_path = str(fs.normalize_path(download_result.content))
-        self.logger.info(f"Downloaded file to: {local_path}")
+        # Initialize once up front so worker threads don't race to do it.
+        if not self._initialized:
+            init_result = self.initialize()
+            if not init_result.success:
+                return [init_result] * len(file_paths)
 
-        file_info_result = self._drive_service.get_file_info(remote_id=file_id)
-        if not file_info_result.success:
-            return IntegrationResult.error_result(
-                f"Failed to get file info from Google Drive: {file_info_result.error}"
-            )
+        if not file_paths:
+            return []
 
-        file_info = file_info_result.content
-        file_name = file_info.get("name", "unknown")
+        options = options or {}
+        if max_workers is None:
+            max_workers = options.get("concurrency") or _get_default_concurrency()
+        max_workers = max(1, min(max_workers, len(file_paths)))
+
+        batch_size = self._batch_size(options)
+        if batch_size <= 1 or self._using_mock:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    self.process_file, file_paths, output_paths, repeat(options)
+                )
+                return list(results)
+
+        # Local files are grouped so several documents share one LLM call;
+        # Drive IDs and unusual inputs still go through process_file.
+        local: list[int] = []
+        single: list[int] = []
+        clean_paths: dict[int, str] = {}
+        for i, file_path in enumerate(file_paths):
+            try:
+                clean_path = _clean_path(file_path)
+            except ValueError:
+                single.append(i)
+                continue
+            if _looks_like_drive_id(clean_path):
+                single.append(i)
+            else:
+                clean_paths[i] = clean_path
+                local.append(i)
+
+        final_results: dict[int, IntegrationResult] = {}
+        batches = [local[i : i + batch_size] for i in range(0, len(local), batch_size)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            single_futures = {
+                i: executor.submit(
+                    self.process_file, file_paths[i], output_paths[i], options
+                )
+                for i in single
+            }
+            batch_futures = {
+                tuple(batch): executor.submit(
+                    self._process_local_batch,
+                    [clean_paths[i] for i in batch],
+                    [output_paths[i] for i in batch],
+                    options,
+                )
+                for batch in batches
+            }
+            for i, future in single_futures.items():
+                final_results[i] = future.result()
+            for batch, future in batch_futures.items():
+                for i, result in zip(batch, future.result(), strict=True):
+                    final_results[i] = result
+        return [final_results[i] for i in range(len(file_paths))]
+
+    def _batch_size(self, options: dict[str, Any]) -> int:
+        """
+        Get the number of local files to send to the LLM per request.
 
-        # Process the downloaded local file.
-        output_str = str(output_path) if output_path else None
-        result = self._process_local_file(local_path, output_str, options)
+        Args:
+            options: Processing options. "batch_size" sets the size; a custom
+                "prompt_template" disables batching unless a
+                "batch_prompt_template" is given too.
 
-        if result.success and not options.get("dry_run", False):
-            metadata_path = result.content.get("metadata_path")
-            if metadata_path:
+        Returns:
+            The batch size; 1 means no batching.
+        """
+        batch_size = options.get("batch_size")
+        if batch_size is None:
+            return 1
+        try:
+            batch_size = int(batch_size)
+        except (TypeError, ValueError):
+            self.logger.warning(f"Invalid batch_size {batch_size!r}, not batching")
+            return 1
+        if batch_size <= 1:
+            return 1
+        if options.get("prompt_template") and not options.get("batch_prompt_template"):
+            self.logger.info(
+                "A custom prompt_template has no batch_prompt_template; "
+                "processing files one by one"
+            )
+            return 1
+        return batch_size
+
+    def _process_local_batch(
+        self,
+        file_paths: list[str],
+        output_paths: list[str | None],
+        options: dict[str, Any],
+    ) -> list[IntegrationResult]:
+        """
+        Process a group of local files with one batched LLM call.
+
+        Args:
+            file_paths: Paths to the local files.
+            output_paths: Optional output paths, one per file.
+            options: Processing options.
+
+        Returns:
+            A list of IntegrationResults in the same order as file_paths.
+        """
+        results: dict[int, IntegrationResult] = {}
+        try:
+            path_strs = [str(fs.normalize_path(path)) for path in file_paths]
+            readable: list[int] = []
+            documents: list[tuple[str, str]] = []
+            for i, path_str in enumerate(path_strs):
+                read_result = self._read_local_file(path_str, options)
+                if read_result.success:
+                    readable.append(i)
+                    documents.append(read_result.content)
+                else:
+                    results[i] = read_result
+
+            metadata_results = self._extract_metadata_batch(documents, options)
+            for i, metadata_result in zip(readable, metadata_results, strict=True):
+                if metadata_result.success:
+                    results[i] = self._write_metadata(
+                        metadata_result.content, path_strs[i], output_paths[i]
+                    )
+                else:
+                    results[i] = metadata_result
+        except Exception as e:
+            self.logger.exception(f"Failed to process batch of local files: {e}")
+            error = IntegrationResult.error_result(f"Failed to process file: {str(e)}")
+            return [results.get(i, error) for i in range(len(file_paths))]
+        return [results[i] for i in range(len(file_paths))]
+
+    async def aprocess_file(
+        self,
+        file_path: str,
+        output_path: str | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> IntegrationResult:
+        """
+        Process a file without blocking the event loop.
+
+        The blocking pipeline runs on a worker thread, so Drive and LLM calls
+        of other files can proceed in the meantime.
+
+        Args:
+            file_path: Path to the file to process (local path or Google Drive ID).
+            output_path: Optional path for the output metadata file.
+            options: Optional processing options.
+
+        Returns:
+            IntegrationResult containing the metadata extraction result.
+        """
+        return await asyncio.to_thread(
+            self.process_file, file_path, output_path, options
+        )
+
+    async def aprocess_files(
+        self,
+        file_paths: list[str],
+        output_paths: list[str | None] | None = None,
+        options: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> list[IntegrationResult]:
+        """
+        Process several files concurrently from async code.
+
+        Args:
+            file_paths: Paths to the files to process (local paths or Google Drive IDs).
+            output_paths: Optional output paths, one per file.
+            options: Optional processing options shared by all files. The
+                "concurrency" option sets the number of files in flight
+                (default: the configured max_concurrency).
+            max_workers: Number of files in flight; overrides the
+                "concurrency" option when given.
+
+        Returns:
+            A list of IntegrationResults in the same order as file_paths.
+        """
+        if output_paths is None:
+            output_paths = [None] * len(file_paths)
+        if len(output_paths) != len(file_paths):
+            error = IntegrationResult.error_result(
+                "output_paths must have the same length as file_paths"
+            )
+            return [error] * len(file_paths)
+
+        # Initialize once up front so worker threads don't race to do it.
+        if not self._initialized:
+            init_result = await asyncio.to_thread(self.initialize)
+            if not init_result.success:
+                return [init_result] * len(file_paths)
+
+        options = options or {}
+        if max_workers is None:
+            max_workers = options.get("concurrency") or _get_default_concurrency()
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def run(file_path: str, output_path: str | None) -> IntegrationResult:
+            async with semaphore:
+                return await self.aprocess_file(file_path, output_path, options)
+
+        return list(
+            await asyncio.gather(
+                *(run(fp, op) for fp, op in zip(file_paths, output_paths))
+            )
+        )
+
+    def _call_drive(self, method: Any, **kwargs: Any) -> Any:
+        """
+        Call a Google Drive service method, respecting the shared rate limit.
+
+        Args:
+            method: Bound GoogleDriveService method to call.
+            **kwargs: Arguments for the method.
+
+        Returns:
+            The method's result.
+        """
+        _drive_rate_limiter.wait()
+        return method(**kwargs)
+
+    def _process_drive_file(
+        self, file_id: str, output_path: str | None, options: dict[str, Any]
+    ) -> IntegrationResult:
+        """
+        Process a file from Google Drive.
+
+        Args:
+            file_id: Google Drive file ID.
+            output_path: Optional path for the output metadata file.
+            options: Processing options.
+
+        Returns:
+            IntegrationResult containing the metadata extraction result.
+        """
+        try:
+            drive_service = self.drive_service
+        except QuackIntegrationError as e:
+            return IntegrationResult.error_result(str(e))
+
+        if self._cache_mode(options) == "off":
+            fetch_result = self._fetch_drive_file(drive_service, file_id)
+        else:
+            fetch_result = self._fetch_drive_file_cached(drive_service, file_id)
+        if not fetch_result.success:
+            return fetch_result
+        local_path, file_info = fetch_result.content
+        file_name = file_info.get("name", "unknown")
+
+        # Process the downloaded local file.
+        output_str = str(output_path) if output_path else None
+        result = self._process_local_file(local_path, output_str, options)
+
+        if result.success and not options.get("dry_run", False):
+            metadata_path = result.content.get("metadata_path")
+            if metadata_path:
                 parent_id = file_info.get("parents", [None])[0]
-                metadata_path_str = str(metadata_path)
-                upload_result = self._drive_service.upload_file(
-                    file_path=metadata_path_str, parent_folder_id=parent_id
-                )
-                if upload_result.success:
-                    result.content["drive_file_id"] = upload_result.content
-                    self.logger.info(
-                        f"Uploaded metadata file to Google Drive with ID: {upload_result.content}"
+                if options.get("background_upload", False):
+                    # The caller gets the result right away; wait_uploads()
+                    # collects the outcome at the end of a batch.
+                    future = self._upload_executor.submit(
+                        self._upload_metadata,
+                        drive_service,
+                        str(metadata_path),
+                        parent_id,
                     )
+                    with self._uploads_lock:
+                        self._pending_uploads.append(future)
+                    result.content["upload_future"] = future
                 else:
-                    self.logger.error(
-                        f"Failed to upload metadata file to Google Drive: {upload_result.error}"
+                    upload_result = self._upload_metadata(
+                        drive_service, str(metadata_path), parent_id
                     )
+                    if upload_result.success:
+                        result.content["drive_file_id"] = upload_result.content
 
         if result.success:
             result.content["original_file_name"] = file_name
 
         return result
 
+    def _upload_metadata(
+        self,
+        drive_service: "GoogleDriveService",
+        metadata_path: str,
+        parent_id: str | None,
+    ) -> IntegrationResult:
+        """
+        Upload a metadata file to Google Drive.
+
+        Args:
+            drive_service: The Google Drive service.
+            metadata_path: Path to the local metadata file.
+            parent_id: ID of the Drive folder to upload into.
+
+        Returns:
+            IntegrationResult containing the uploaded file's ID.
+        """
+        upload_result = self._call_drive(
+            drive_service.upload_file,
+            file_path=metadata_path,
+            parent_folder_id=parent_id,
+        )
+        if upload_result.success:
+            self.logger.info(
+                f"Uploaded metadata file to Google Drive with ID: {upload_result.content}"
+            )
+        else:
+            self.logger.error(
+                f"Failed to upload metadata file to Google Drive: {upload_result.error}"
+            )
+        return upload_result
+
+    def wait_uploads(self, timeout: float | None = None) -> list[IntegrationResult]:
+        """
+        Wait for background uploads started with the "background_upload" option.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait for all.
+
+        Returns:
+            IntegrationResults of the uploads that finished, in submission
+            order. Unfinished uploads stay pending for a later call.
+        """
+        with self._uploads_lock:
+            pending = list(self._pending_uploads)
+        done, _ = wait(pending, timeout=timeout)
+
+        results = []
+        for future in pending:
+            if future not in done:
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                self.logger.error(f"Background upload failed: {e}")
+                results.append(IntegrationResult.error_result(f"Upload failed: {e}"))
+        with self._uploads_lock:
+            self._pending_uploads = [
+                f for f in self._pending_uploads if f not in done
+            ]
+        return results
+
+    def _make_download_dir(self) -> str:
+        """
+        Create a scratch directory for one Drive download.
+
+        Concurrent downloads of files with the same name would otherwise
+        overwrite each other in the shared temp directory.
+
+        Returns:
+            Path to the new directory.
+        """
+        return tempfile.mkdtemp(prefix="download_", dir=self._temp_dir)
+
+    def _fetch_drive_file(
+        self, drive_service: "GoogleDriveService", file_id: str
+    ) -> IntegrationResult:
+        """
+        Download a Drive file and fetch its metadata.
+
+        Args:
+            drive_service: The Google Drive service.
+            file_id: Google Drive file ID.
+
+        Returns:
+            IntegrationResult containing a (local_path, file_info) tuple.
+        """
+        self.logger.info(f"Downloading file from Google Drive with ID: {file_id}")
+
+        # The download and the metadata lookup don't depend on each other, so
+        # both requests are in flight at the same time.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            download_future = executor.submit(
+                self._call_drive,
+                drive_service.download_file,
+                remote_id=file_id,
+                local_path=self._make_download_dir(),
+            )
+            file_info_future = executor.submit(
+                self._call_drive, drive_service.get_file_info, remote_id=file_id
+            )
+            download_result = download_future.result()
+            file_info_result = file_info_future.result()
+
+        if not download_result.success:
+            return IntegrationResult.error_result(
+                f"Failed to download file from Google Drive: {download_result.error}"
+            )
+
+        local_path = str(fs.normalize_path(download_result.content))
+        self.logger.info(f"Downloaded file to: {local_path}")
+
+        if not file_info_result.success:
+            return IntegrationResult.error_result(
+                f"Failed to get file info from Google Drive: {file_info_result.error}"
+            )
+
+        return IntegrationResult.success_result(
+            content=(local_path, file_info_result.content)
+        )
+
+    def _download_drive_file(
+        self, drive_service: "GoogleDriveService", file_id: str
+    ) -> IntegrationResult:
+        """
+        Download a Drive file into its own scratch directory.
+
+        Args:
+            drive_service: The Google Drive service.
+            file_id: Google Drive file ID.
+
+        Returns:
+            IntegrationResult containing the normalized local path.
+        """
+        self.logger.info(f"Downloading file from Google Drive with ID: {file_id}")
+        download_result = self._call_drive(
+            drive_service.download_file,
+            remote_id=file_id,
+            local_path=self._make_download_dir(),
+        )
+        if not download_result.success:
+            return IntegrationResult.error_result(
+                f"Failed to download file from Google Drive: {download_result.error}"
+            )
+        return IntegrationResult.success_result(
+            content=str(fs.normalize_path(download_result.content))
+        )
+
+    def _fetch_drive_file_cached(
+        self, drive_service: "GoogleDriveService", file_id: str
+    ) -> IntegrationResult:
+        """
+        Fetch a Drive file, reusing a local copy if its content hasn't changed.
+
+        The metadata is fetched first so its md5Checksum can be checked against
+        the download cache; on a hit the download is skipped entirely. Files
+        whose metadata has no md5Checksum, such as Google-native documents or
+        responses from a get_file_info that doesn't request the field, are
+        downloaded without caching.
+
+        Args:
+            drive_service: The Google Drive service.
+            file_id: Google Drive file ID.
+
+        Returns:
+            IntegrationResult containing a (local_path, file_info) tuple.
+        """
+        file_info_result = self._call_drive(
+            drive_service.get_file_info, remote_id=file_id
+        )
+        if not file_info_result.success:
+            return IntegrationResult.error_result(
+                f"Failed to get file info from Google Drive: {file_info_result.error}"
+            )
+        file_info = file_info_result.content
+
+        checksum = file_info.get("md5Checksum")
+        if not checksum:
+            # The metadata is already here, so only the download is needed.
+            download_result = self._download_drive_file(drive_service, file_id)
+            if not download_result.success:
+                return download_result
+            return IntegrationResult.success_result(
+                content=(download_result.content, file_info)
+            )
+
+        size = file_info.get("size")
+        cached_path = self._download_cache.get(
+            file_id, checksum, int(size) if size else None
+        )
+        if cached_path is not None:
+            self.logger.info(f"Using cached download of Drive file {file_id}")
+            return IntegrationResult.success_result(content=(cached_path, file_info))
+
+        download_result = self._download_drive_file(drive_service, file_id)
+        if not download_result.success:
+            return download_result
+
+        downloaded_path = download_result.content
+        try:
+            downloaded_md5 = _file_md5(downloaded_path)
+        except OSError as e:
+            return IntegrationResult.error_result(
+                f"Failed to read downloaded file: {str(e)}"
+            )
+        if downloaded_md5 != checksum:
+            # The file changed between the two requests; use it, but don't
+            # cache it under a checksum it doesn't have.
+            self.logger.warning(
+                f"Downloaded Drive file {file_id} doesn't match its md5Checksum; "
+                "not caching it"
+            )
+            return IntegrationResult.success_result(
+                content=(downloaded_path, file_info)
+            )
+        local_path = self._download_cache.put(file_id, checksum, downloaded_path)
+        self.logger.info(f"Downloaded file to: {local_path}")
+        return IntegrationResult.success_result(content=(local_path, file_info))
+
     def _process_local_file(
-        self, file_path: str, output_path: str | None, options: dict[str, Any]
+        self,
+        file_path: str,
+        output_path: str | None,
+        options: dict[str, Any],
+        file_info: Any = None,
     ) -> IntegrationResult:
         """
         Process a local file.
@@ -358,76 +1475,132 @@ class MetadataPlugin(QuackToolPluginProtocol):
             file_path: Path to the local file.
             output_path: Optional path for the output metadata file.
             options: Processing options.
+            file_info: Result of an fs.get_file_info call the caller already
+                made for this path, to avoid a second stat.
 
         Returns:
             IntegrationResult containing the metadata extraction result.
         """
         file_path_str = str(fs.normalize_path(file_path))
-        file_info = fs.get_file_info(file_path_str)
-        if not file_info.success or not file_info.exists:
-            return IntegrationResult.error_result(f"File not found: {file_path_str}")
-        if not file_info.is_file:
-            return IntegrationResult.error_result(f"Not a file: {file_path_str}")
-
         try:
-            self.logger.info(f"Reading file: {file_path_str}")
-            read_result = fs.read_text(file_path_str, encoding="utf-8")
+            read_result = self._read_local_file(file_path_str, options, file_info)
             if not read_result.success:
-                return IntegrationResult.error_result(
-                    f"Failed to read file: {read_result.error}"
-                )
-            content = read_result.content
+                return read_result
+            content, content_hash = read_result.content
 
-            metadata_result = self._extract_metadata(content=content, options=options)
+            metadata_result = self._extract_metadata(
+                content=content, options=options, content_hash=content_hash
+            )
             if not metadata_result.success:
                 return metadata_result
-            metadata = metadata_result.content
-
-            # Determine or generate the output metadata file path.
-            if output_path:
-                metadata_path = str(fs.normalize_path(output_path))
-            else:
-                parts = fs.split_path(file_path_str)
-                file_name = parts[-1]
-                stem = file_name.rsplit(".", 1)[0]
-                metadata_path = fs.join_path(
-                    str(self._output_dir), f"{stem}.metadata.json"
-                )
 
-            self.logger.info(f"Writing metadata to: {metadata_path}")
-            metadata_dict = metadata.model_dump()
-            write_result = fs.write_json(
-                metadata_path, metadata_dict, atomic=True, indent=2
+            return self._write_metadata(
+                metadata_result.content, file_path_str, output_path
             )
-            if not write_result.success:
+        except Exception as e:
+            self.logger.exception(f"Failed to process local file: {e}")
+            return IntegrationResult.error_result(f"Failed to process file: {str(e)}")
+
+    def _read_local_file(
+        self, file_path_str: str, options: dict[str, Any], file_info: Any = None
+    ) -> IntegrationResult:
+        """
+        Check that a local file exists and read it.
+
+        Args:
+            file_path_str: Normalized path to the local file.
+            options: Processing options.
+            file_info: Result of an fs.get_file_info call the caller already
+                made for this path, to avoid a second stat.
+
+        Returns:
+            IntegrationResult containing a (content, content_hash) tuple.
+        """
+        if file_info is not None:
+            if not file_info.success or not file_info.exists:
                 return IntegrationResult.error_result(
-                    f"Failed to write metadata file: {write_result.error}"
+                    f"File not found: {file_path_str}"
                 )
+            is_file = file_info.is_file
+        else:
+            # Only existence and type are needed, so a bare stat is enough.
+            try:
+                is_file = stat.S_ISREG(os.stat(file_path_str).st_mode)
+            except FileNotFoundError:
+                return IntegrationResult.error_result(
+                    f"File not found: {file_path_str}"
+                )
+            except OSError as e:
+                return IntegrationResult.error_result(
+                    f"Cannot access file {file_path_str}: {e}"
+                )
+        if not is_file:
+            return IntegrationResult.error_result(f"Not a file: {file_path_str}")
 
-            card = self._create_metadata_card(metadata)
-            filename_parts = fs.split_path(file_path_str)
-            file_name = filename_parts[-1] if filename_parts else file_path_str
+        self.logger.info(f"Reading file: {file_path_str}")
+        try:
+            content, content_hash = _read_and_hash(
+                file_path_str, options.get("max_read_bytes")
+            )
+        except (OSError, ValueError) as e:
+            return IntegrationResult.error_result(f"Failed to read file: {e}")
+        return IntegrationResult.success_result(content=(content, content_hash))
 
-            message = f"Successfully extracted metadata from {file_name}"
-            if self._using_mock:
-                message += " (using mock data - not actual language model analysis)"
+    def _write_metadata(
+        self, metadata: Metadata, file_path_str: str, output_path: str | None
+    ) -> IntegrationResult:
+        """
+        Write extracted metadata next to the other outputs and build the result.
 
-            return IntegrationResult.success_result(
-                content={
-                    "metadata": metadata_dict,
-                    "metadata_path": metadata_path,
-                    "card": card,
-                    "using_mock": self._using_mock,
-                },
-                message=message,
+        Args:
+            metadata: The extracted metadata.
+            file_path_str: Normalized path to the source file.
+            output_path: Optional path for the output metadata file.
+
+        Returns:
+            IntegrationResult containing the metadata, its path, and the card.
+        """
+        # Split the path once; the name is used for the output path and the message.
+        file_name = os.path.basename(file_path_str) or file_path_str
+
+        # Determine or generate the output metadata file path.
+        if output_path:
+            metadata_path = str(fs.normalize_path(output_path))
+        else:
+            stem = os.path.splitext(file_name)[0]
+            metadata_path = fs.join_path(str(self._output_dir), f"{stem}.metadata.json")
+
+        self.logger.info(f"Writing metadata to: {metadata_path}")
+        # Serialize straight from the model instead of dumping to a dict first.
+        write_result = fs.write_text(
+            metadata_path,
+            metadata.model_dump_json(indent=2),
+            encoding="utf-8",
+            atomic=True,
+        )
+        if not write_result.success:
+            return IntegrationResult.error_result(
+                f"Failed to write metadata file: {write_result.error}"
             )
 
-        except Exception as e:
-            self.logger.exception(f"Failed to process local file: {e}")
-            return IntegrationResult.error_result(f"Failed to process file: {str(e)}")
+        card = self._create_metadata_card(metadata)
+
+        message = f"Successfully extracted metadata from {file_name}"
+        if self._using_mock:
+            message += " (using mock data - not actual language model analysis)"
+
+        return IntegrationResult.success_result(
+            content={
+                "metadata": metadata.model_dump(),
+                "metadata_path": metadata_path,
+                "card": card,
+                "using_mock": self._using_mock,
+            },
+            message=message,
+        )
 
     def _extract_metadata(
-        self, content: str, options: dict[str, Any]
+        self, content: str, options: dict[str, Any], content_hash: str | None = None
     ) -> IntegrationResult:
         """
         Extract metadata from content using an LLM.
@@ -435,43 +1608,63 @@ class MetadataPlugin(QuackToolPluginProtocol):
         Args:
             content: Text content to extract metadata from.
             options: Processing options.
+            content_hash: Hex SHA-256 digest of the source bytes, if already
+                known. Computed from the content otherwise.
 
         Returns:
             IntegrationResult containing the extracted metadata.
         """
         max_retries = options.get("retries", 3)
-        prompt_template = options.get("prompt_template")
+        if self._using_mock:
+            # The mock client returns scripted responses, so retrying can't help.
+            max_retries = 1
         verbose = options.get("verbose", False)
-
-        if prompt_template:
-            template_path = str(fs.normalize_path(prompt_template))
-        else:
-            template_path = get_template_path("generic", "metadata")
-            template_path = (
-                str(template_path)
-                if hasattr(template_path, "as_posix")
-                else template_path
-            )
+        template_path = self._resolve_template_path(options)
+
+        # The key is built from the inputs rather than the rendered prompt, so
+        # a hit skips truncation and rendering.
+        use_cache = self._cache_mode(options) != "off"
+        cache_key = (
+            self._metadata_cache_key(template_path, content, content_hash, options)
+            if use_cache
+            else None
+        )
+        if cache_key is not None:
+            metadata = self._get_cached_metadata(cache_key)
+            if metadata is not None:
+                return IntegrationResult.success_result(
+                    content=metadata, message="Loaded metadata from cache"
+                )
 
         try:
-            prompt = render_prompt(
+            content = self._fit_content_to_budget(content, template_path, options)
+            system_prompt, user_prompt = render_prompt_parts(
                 template_path=template_path, context={"content": content}
             )
         except Exception as e:
             return IntegrationResult.error_result(f"Failed to render prompt: {str(e)}")
 
         if verbose:
-            self.logger.info(f"Generated prompt:\n{prompt}")
-
-        messages = [ChatMessage(role=RoleType.USER, content=prompt)]
-        llm_options = LLMOptions(temperature=0.1, max_tokens=2000)
+            self.logger.info(f"Generated prompt:\n{system_prompt}{user_prompt}")
+
+        # The static instructions go first in their own message so providers can
+        # serve them from their prompt cache; only the document changes per call.
+        base_messages = []
+        if system_prompt:
+            base_messages.append(
+                ChatMessage(role=RoleType.SYSTEM, content=system_prompt)
+            )
+        base_messages.append(ChatMessage(role=RoleType.USER, content=user_prompt))
+        messages = base_messages
+        llm_options = self._build_llm_options(options)
+        fixup_llm_options = None
 
         for attempt in range(max_retries):
             try:
                 self.logger.info(
                     f"Sending prompt to LLM (attempt {attempt + 1}/{max_retries})"
                 )
-                result = self._llm_service.chat(messages=messages, options=llm_options)
+                result = self._chat(messages, llm_options)
                 if not result.success:
                     self.logger.error(f"LLM call failed: {result.error}")
                     if "API key" in str(result.error):
@@ -479,7 +1672,7 @@ class MetadataPlugin(QuackToolPluginProtocol):
                             f"LLM API key error: {result.error}. Please configure your API key in quack_config.yaml or set the appropriate environment variable."
                         )
                     if attempt < max_retries - 1:
-                        time.sleep(1)
+                        time.sleep(_compute_backoff(attempt, result.error))
                         continue
                     return IntegrationResult.error_result(
                         f"Failed to get response from LLM: {result.error}"
@@ -491,17 +1684,14 @@ class MetadataPlugin(QuackToolPluginProtocol):
 
                 try:
                     json_str = self._extract_json(response)
-                    parse_result = fs.read_json(json_str)
-                    if not parse_result.success:
-                        raise ValueError(f"Failed to parse JSON: {parse_result.error}")
-                    metadata_dict = parse_result.data
-                    metadata = Metadata.model_validate(metadata_dict)
-                    calculated_rarity = calculate_rarity(metadata.summary)
-                    if calculated_rarity != metadata.rarity:
-                        self.logger.info(
-                            f"Overriding LLM rarity '{metadata.rarity}' with calculated rarity '{calculated_rarity}'"
-                        )
-                        metadata.rarity = calculated_rarity
+                    # Parse and validate in one pass, without an intermediate dict.
+                    metadata = Metadata.model_validate_json(json_str)
+                    self._apply_calculated_rarity(metadata)
+
+                    # A repaired response may have been completed by the
+                    # model rather than extracted, so it isn't cached.
+                    if cache_key is not None and messages is base_messages:
+                        self._cache.put(cache_key, metadata.model_dump_json())
 
                     return IntegrationResult.success_result(
                         content=metadata, message="Successfully extracted metadata"
@@ -510,23 +1700,48 @@ class MetadataPlugin(QuackToolPluginProtocol):
                     self.logger.error(f"Error parsing or validating metadata: {e}")
                     if verbose:
                         self.logger.error(f"Invalid response: {response}")
+                    parse_error = e
 
                 if attempt < max_retries - 1:
-                    messages.append(
-                        ChatMessage(role=RoleType.ASSISTANT, content=response)
-                    )
-                    messages.append(
-                        ChatMessage(
-                            role=RoleType.USER,
-                            content="The response couldn't be properly parsed as JSON or didn't match the required schema. "
-                            "Please provide a valid JSON response with all required fields using the exact structure specified in the initial prompt. Return only the JSON object with no markdown or additional text.",
+                    # Broken JSON is repaired from the response alone; a
+                    # schema mismatch is retried with the original prompt so
+                    # the fields come from the document. Retries run at
+                    # temperature 0 so they are deterministic.
+                    error = _describe_parse_error(parse_error)
+                    if _is_json_syntax_error(parse_error):
+                        messages = [
+                            ChatMessage(
+                                role=RoleType.SYSTEM,
+                                content=_get_fixup_system_prompt(),
+                            ),
+                            ChatMessage(
+                                role=RoleType.USER,
+                                content=_FIXUP_REQUEST.format(
+                                    error=error, response=response
+                                ),
+                            ),
+                        ]
+                    else:
+                        messages = [
+                            *base_messages,
+                            ChatMessage(role=RoleType.ASSISTANT, content=response),
+                            ChatMessage(
+                                role=RoleType.USER,
+                                content=_FIXUP_WITH_DOCUMENT_REQUEST.format(
+                                    error=error
+                                ),
+                            ),
+                        ]
+                    if fixup_llm_options is None:
+                        fixup_llm_options = self._build_llm_options(
+                            options, temperature=0.0
                         )
-                    )
-                    time.sleep(1)
+                    llm_options = fixup_llm_options
+                    time.sleep(_compute_backoff(attempt))
             except Exception as e:
                 self.logger.exception(f"Error during metadata extraction: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(1)
+                    time.sleep(_compute_backoff(attempt, e))
                 else:
                     return IntegrationResult.error_result(
                         f"Failed to extract metadata after {max_retries} attempts: {str(e)}"
@@ -536,24 +1751,446 @@ class MetadataPlugin(QuackToolPluginProtocol):
             f"Failed to extract valid metadata after {max_retries} attempts"
         )
 
+    def _extract_metadata_batch(
+        self, documents: list[tuple[str, str]], options: dict[str, Any]
+    ) -> list[IntegrationResult]:
+        """
+        Extract metadata from several documents with a single LLM call.
+
+        Cached documents are served from the cache. The rest are sent together
+        in one prompt that asks for a JSON array of results; if that call fails
+        or its response doesn't line up with the documents, each of them is
+        extracted on its own instead.
+
+        Args:
+            documents: (content, content_hash) tuples.
+            options: Processing options. "batch_prompt_template" overrides the
+                batch template.
+
+        Returns:
+            IntegrationResults containing the extracted metadata, one per
+            document and in the same order.
+        """
+        template_path = self._resolve_template_path(options)
+        batch_template_path = self._resolve_batch_template_path(options)
+        use_cache = self._cache_mode(options) != "off"
+
+        # The budget is fixed by the size of the group, not by how many of its
+        # documents miss the cache, so batch cache keys are stable across runs.
+        try:
+            per_document = self._batch_document_budget(
+                batch_template_path, len(documents), options
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to render batch prompt: {e}")
+            per_document = 0
+        if per_document <= 0 and len(documents) > 1:
+            self.logger.warning(
+                f"max_input_tokens is too small to batch {len(documents)} "
+                "documents; processing them one by one"
+            )
+
+        results: dict[int, IntegrationResult] = {}
+        batch_keys: list[str | None] = [None] * len(documents)
+        pending = []
+        for i, (content, content_hash) in enumerate(documents):
+            metadata = None
+            if use_cache:
+                # A single-document result covers more of the document, so it
+                # is preferred over one from an earlier batch.
+                metadata = self._get_cached_metadata(
+                    self._metadata_cache_key(
+                        template_path, content, content_hash, options
+                    )
+                )
+                if per_document > 0:
+                    batch_keys[i] = self._metadata_cache_key(
+                        batch_template_path,
+                        content,
+                        content_hash,
+                        options,
+                        batch_budget=per_document,
+                    )
+                    if metadata is None:
+                        metadata = self._get_cached_metadata(batch_keys[i])
+            if metadata is None:
+                pending.append(i)
+            else:
+                results[i] = IntegrationResult.success_result(
+                    content=metadata, message="Loaded metadata from cache"
+                )
+
+        if len(pending) > 1 and per_document > 0:
+            batch_metadata = self._request_metadata_batch(
+                [documents[i][0] for i in pending],
+                options,
+                batch_template_path,
+                per_document,
+            )
+            if batch_metadata is not None:
+                for i, metadata in zip(pending, batch_metadata, strict=True):
+                    batch_key = batch_keys[i]
+                    if batch_key is not None:
+                        self._cache.put(batch_key, metadata.model_dump_json())
+                    results[i] = IntegrationResult.success_result(
+                        content=metadata, message="Successfully extracted metadata"
+                    )
+                pending = []
+
+        for i in pending:
+            content, content_hash = documents[i]
+            results[i] = self._extract_metadata(
+                content=content, options=options, content_hash=content_hash
+            )
+        return [results[i] for i in range(len(documents))]
+
+    def _resolve_batch_template_path(self, options: dict[str, Any]) -> str:
+        """
+        Get the path of the batch prompt template.
+
+        Args:
+            options: Processing options. "batch_prompt_template" overrides the
+                default.
+
+        Returns:
+            The template path.
+        """
+        batch_template = options.get("batch_prompt_template")
+        if batch_template:
+            return str(fs.normalize_path(batch_template))
+        return get_template_path("batch", "metadata")
+
+    def _batch_document_budget(
+        self, template_path: str, count: int, options: dict[str, Any]
+    ) -> int:
+        """
+        Split the input token budget evenly between the documents of a batch.
+
+        As for a single document (see _fit_content_to_budget), the budget
+        covers the prompt and the response, so the response's max_tokens is
+        reserved before the rest is split.
+
+        Args:
+            template_path: Path to the batch prompt template.
+            count: Number of documents in the batch.
+            options: Processing options. "max_input_tokens" sets the budget
+                for the whole prompt.
+
+        Returns:
+            The token budget for each document; zero or less if the documents
+            don't fit.
+        """
+        max_input_tokens = options.get("max_input_tokens", DEFAULT_MAX_INPUT_TOKENS)
+        static_prefix, empty_suffix = render_prompt_parts(
+            template_path=template_path, context={"rows": []}
+        )
+        overhead = count_tokens(static_prefix + empty_suffix, options.get("llm_model"))
+        response_tokens = self._batch_response_tokens(count, options)
+        budget = max_input_tokens - overhead - response_tokens
+        return budget // count - _BATCH_ROW_OVERHEAD_TOKENS
+
+    def _batch_response_tokens(self, count: int, options: dict[str, Any]) -> int:
+        """
+        Get the max_tokens of a batched request.
+
+        Args:
+            count: Number of documents in the batch.
+            options: Processing options. "max_output_tokens" caps the length
+                of the response.
+
+        Returns:
+            _MAX_RESPONSE_TOKENS per document, up to max_output_tokens.
+        """
+        max_output_tokens = options.get(
+            "max_output_tokens", _DEFAULT_MAX_OUTPUT_TOKENS
+        )
+        return min(_MAX_RESPONSE_TOKENS * count, max_output_tokens)
+
+    def _request_metadata_batch(
+        self,
+        contents: list[str],
+        options: dict[str, Any],
+        template_path: str,
+        per_document: int,
+    ) -> list[Metadata] | None:
+        """
+        Send several documents to the LLM in one prompt.
+
+        Args:
+            contents: Text contents to extract metadata from.
+            options: Processing options. "max_output_tokens" caps the length
+                of the response.
+            template_path: Path to the batch prompt template.
+            per_document: Token budget for each document's excerpt.
+
+        Returns:
+            The metadata for each document in order, or None if the batch
+            request failed and the documents should be processed one by one.
+        """
+        count = len(contents)
+        model = options.get("llm_model")
+        try:
+            rows = [
+                {
+                    "idx": i + 1,
+                    "content": truncate_content(content, per_document, model),
+                }
+                for i, content in enumerate(contents)
+            ]
+            system_prompt, user_prompt = render_prompt_parts(
+                template_path=template_path, context={"rows": rows}
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to render batch prompt: {e}")
+            return None
+
+        messages = []
+        if system_prompt:
+            messages.append(ChatMessage(role=RoleType.SYSTEM, content=system_prompt))
+        messages.append(ChatMessage(role=RoleType.USER, content=user_prompt))
+        llm_options = self._build_llm_options(
+            options, max_tokens=self._batch_response_tokens(count, options)
+        )
+
+        self.logger.info(f"Sending batch of {count} documents to LLM")
+        try:
+            result = self._chat(messages, llm_options)
+            if not result.success:
+                self.logger.warning(f"Batch LLM call failed: {result.error}")
+                return None
+            payload = json.loads(self._extract_json(result.content))
+            items = payload["results"] if isinstance(payload, dict) else payload
+            batch_metadata = METADATA_LIST_ADAPTER.validate_python(
+                _order_batch_rows(items, count)
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not use batch response: {e}")
+            return None
+
+        for metadata in batch_metadata:
+            self._apply_calculated_rarity(metadata)
+        return batch_metadata
+
+    def _cache_mode(self, options: dict[str, Any]) -> str:
+        """
+        Get the metadata cache mode for a run.
+
+        Args:
+            options: Processing options. "cache" is "exact" (the default),
+                "normalized" (ignore whitespace differences), or "off"; the
+                older "no_cache" flag maps to "off".
+
+        Returns:
+            The cache mode. Always "off" with the mock client, so simulated
+            results can't leak into real runs.
+        """
+        if self._using_mock:
+            return "off"
+        default = "off" if options.get("no_cache", False) else "exact"
+        return options.get("cache") or default
+
+    def _resolve_template_path(self, options: dict[str, Any]) -> str:
+        """
+        Get the path of the single-document prompt template.
+
+        Args:
+            options: Processing options. "prompt_template" overrides the default.
+
+        Returns:
+            The template path.
+        """
+        prompt_template = options.get("prompt_template")
+        if prompt_template:
+            return str(fs.normalize_path(prompt_template))
+        return get_template_path("generic", "metadata")
+
+    def _metadata_cache_key(
+        self,
+        template_path: str,
+        content: str,
+        content_hash: str | None,
+        options: dict[str, Any],
+        batch_budget: int | None = None,
+    ) -> str:
+        """
+        Build the metadata cache key for a document.
+
+        In "normalized" cache mode the document is identified by its text with
+        whitespace collapsed, so copies that differ only in spacing or line
+        breaks share an entry. Otherwise the digest of its bytes is used.
+
+        Args:
+            template_path: Path to the single-document prompt template.
+            content: Text content of the document.
+            content_hash: Hex SHA-256 digest of the source bytes, if already
+                known. Computed from the content otherwise.
+            options: Processing options.
+            batch_budget: Per-document token budget when the metadata comes
+                from a batched request, whose excerpts are shorter than those
+                of the single-document path.
+
+        Returns:
+            The cache key.
+        """
+        if self._cache_mode(options) == "normalized":
+            content_hash = "normalized:" + _normalized_content_hash(content)
+        elif content_hash is None:
+            content_hash = hashlib.sha256(
+                content.encode("utf-8", errors="replace")
+            ).hexdigest()
+        provider, default_model = self._llm_identity
+        return MetadataCache.make_key(
+            provider,
+            options.get("llm_model") or default_model,
+            (
+                f"batch:{batch_budget}"
+                if batch_budget is not None
+                else str(options.get("max_input_tokens", DEFAULT_MAX_INPUT_TOKENS))
+            ),
+            _template_fingerprint(template_path),
+            content_hash,
+        )
+
+    def _get_cached_metadata(self, cache_key: str) -> Metadata | None:
+        """
+        Load metadata from the cache.
+
+        Args:
+            cache_key: Key from _metadata_cache_key().
+
+        Returns:
+            The cached metadata, or None on a miss or an invalid entry.
+        """
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
+        try:
+            metadata = Metadata.model_validate_json(cached)
+        except Exception as e:
+            self.logger.warning(f"Ignoring invalid cache entry: {e}")
+            return None
+        self.logger.info("Using cached metadata for identical content")
+        return metadata
+
+    def _apply_calculated_rarity(self, metadata: Metadata) -> None:
+        """
+        Replace the LLM's rarity with the one calculated from the summary.
+
+        Args:
+            metadata: Metadata to update in place.
+        """
+        calculated_rarity = calculate_rarity(metadata.summary)
+        if calculated_rarity != metadata.rarity:
+            self.logger.info(
+                f"Overriding LLM rarity '{metadata.rarity}' with calculated rarity '{calculated_rarity}'"
+            )
+            metadata.rarity = calculated_rarity
+
+    def _chat(
+        self, messages: list[ChatMessage], llm_options: LLMOptions
+    ) -> IntegrationResult:
+        """
+        Send a chat request, waiting for a free LLM call slot.
+
+        Args:
+            messages: Messages to send.
+            llm_options: Options for the chat call.
+
+        Returns:
+            IntegrationResult containing the response text.
+        """
+        with _get_llm_call_slots():
+            return self._llm_service.chat(messages=messages, options=llm_options)
+
+    def _fit_content_to_budget(
+        self, content: str, template_path: str, options: dict[str, Any]
+    ) -> str:
+        """
+        Truncate content so the rendered prompt fits the input token budget.
+
+        Args:
+            content: Text content to extract metadata from.
+            template_path: Path to the prompt template.
+            options: Processing options. "max_input_tokens" sets the budget
+                for the whole prompt.
+
+        Returns:
+            The content, truncated to its head and tail if it is too long.
+        """
+        max_input_tokens = options.get("max_input_tokens", DEFAULT_MAX_INPUT_TOKENS)
+        model = options.get("llm_model")
+
+        # Render the template without content to measure its fixed overhead.
+        static_prefix, empty_suffix = render_prompt_parts(
+            template_path=template_path, context={"content": ""}
+        )
+        overhead = count_tokens(static_prefix + empty_suffix, model)
+        budget = max_input_tokens - overhead - _MAX_RESPONSE_TOKENS
+        return truncate_content(content, budget, model)
+
+    def _build_llm_options(
+        self,
+        options: dict[str, Any],
+        temperature: float = 0.1,
+        max_tokens: int = _MAX_RESPONSE_TOKENS,
+    ) -> LLMOptions:
+        """
+        Build the LLM options for a metadata extraction call.
+
+        Args:
+            options: Processing options. "llm_model" selects the model (the
+                provider default is used when unset) and "json_mode" asks the
+                provider to return a bare JSON object.
+            temperature: Sampling temperature.
+            max_tokens: Upper bound on the length of the response.
+
+        Returns:
+            LLMOptions for the chat call.
+        """
+        llm_kwargs: dict[str, Any] = {
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if options.get("llm_model"):
+            llm_kwargs["model"] = options["llm_model"]
+        if options.get("json_mode", False):
+            llm_kwargs["response_format"] = {"type": "json_object"}
+        return LLMOptions(**llm_kwargs)
+
     def _extract_json(self, text: str) -> str:
         """
         Extract JSON from text, handling markdown code blocks.
 
+        A response that starts with JSON is decoded from its first character,
+        so any trailing note is dropped. JSON inside a code fence or after
+        prose is located by the fence or by decoding from the first brace.
+
         Args:
             text: Text that may contain JSON.
 
         Returns:
             Extracted JSON string.
         """
-        if "```json" in text and "```" in text.split("```json", 1)[1]:
-            json_part = text.split("```json", 1)[1].split("```", 1)[0].strip()
-            return json_part
-        elif "```" in text and "```" in text.split("```", 1)[1]:
-            json_part = text.split("```", 1)[1].split("```", 1)[0].strip()
-            return json_part
-        else:
-            return text.strip()
+        stripped = text.strip()
+        if stripped[:1] in ("{", "["):
+            try:
+                _, end = _JSON_DECODER.raw_decode(stripped)
+                return stripped[:end]
+            except json.JSONDecodeError:
+                pass
+
+        match = _JSON_FENCE.search(text)
+        if match:
+            return match.group(1)
+
+        start = text.find("{")
+        if start != -1:
+            try:
+                _, end = _JSON_DECODER.raw_decode(text, start)
+                return text[start:end]
+            except json.JSONDecodeError:
+                pass
+        return stripped
 
     def _create_metadata_card(self, metadata: Metadata) -> str:
         """
@@ -565,24 +2202,10 @@ class MetadataPlugin(QuackToolPluginProtocol):
         Returns:
             A string representing the metadata card.
         """
-        title = metadata.title
-        domain = metadata.domain
-        tone = metadata.tone
-        rarity = metadata.rarity
-
-        card = [
-            "╔══════════════════════════════════════════╗",
-            "║            🃏 METADATA CARD              ║",
-            "╠══════════════════════════════════════════╣",
-        ]
-        card.append(f"║ Title: {title[:30]:30}║")
-        card.append(f"║ Domain: {domain[:28]:28}║")
-        card.append(f"║ Tone: {tone[:31]:31}║")
-        card.append(f"║ Rarity: {rarity[:29]:29}║")
-
-        if self._using_mock:
-            card.append("╠══════════════════════════════════════════╣")
-            card.append("║ ⚠️ USING MOCK LLM - DATA IS SIMULATED ⚠️  ║")
-
-        card.append("╚══════════════════════════════════════════╝")
-        return "\n".join(card)
+        return _CARD_TEMPLATE.format(
+            title=metadata.title,
+            domain=metadata.domain,
+            tone=metadata.tone,
+            rarity=metadata.rarity,
+            mock_block=_MOCK_CARD_BLOCK if self._using_mock else "",
+        )
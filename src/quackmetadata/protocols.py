@@ -7,15 +7,18 @@ compatible with QuackCore and QuackMetadata.
 """
 
 from logging import Logger
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 from quackcore.integrations.core.results import IntegrationResult
 from quackcore.plugins.protocols import QuackPluginMetadata, QuackPluginProtocol
 
 
-@runtime_checkable
 class QuackToolPluginProtocol(QuackPluginProtocol, Protocol):
-    """Protocol for QuackTool plugins."""
+    """
+    Protocol for QuackTool plugins.
+
+    This is a static typing contract only; it is not runtime-checkable.
+    """
 
     # Add initialization state attribute to the protocol
     _initialized: bool
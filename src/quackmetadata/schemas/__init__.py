@@ -3,6 +3,10 @@
 Schema definitions package for QuackMetadata.
 """
 
-from quackmetadata.schemas.metadata import AuthorProfile, Metadata
+from quackmetadata.schemas.metadata import (
+    METADATA_LIST_ADAPTER,
+    AuthorProfile,
+    Metadata,
+)
 
-__all__ = ["AuthorProfile", "Metadata"]
+__all__ = ["AuthorProfile", "Metadata", "METADATA_LIST_ADAPTER"]
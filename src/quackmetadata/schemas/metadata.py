@@ -6,7 +6,9 @@ This module contains Pydantic models that define the structure of metadata
 extracted from documents by the QuackMetadata tool.
 """
 
-from pydantic import BaseModel, Field
+from collections.abc import Sequence
+
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class AuthorProfile(BaseModel):
@@ -51,3 +53,34 @@ class Metadata(BaseModel):
     author_profile: AuthorProfile = Field(
         description="Generated profile of the likely author"
     )
+
+    @classmethod
+    def to_columnar(cls, items: Sequence["Metadata"]) -> dict[str, list]:
+        """
+        Convert a batch of metadata into one list per field.
+
+        The columnar layout can be passed directly to tabular libraries
+        (e.g. pyarrow.table, polars.DataFrame, or DuckDB). Author profile
+        fields are flattened into "author_profile.<field>" columns.
+
+        Args:
+            items: Metadata objects to convert.
+
+        Returns:
+            A dict mapping column names to lists of values, in item order.
+        """
+        columns: dict[str, list] = {}
+        for name in cls.model_fields:
+            if name == "author_profile":
+                profiles = [item.author_profile for item in items]
+                for profile_field in AuthorProfile.model_fields:
+                    columns[f"author_profile.{profile_field}"] = [
+                        getattr(profile, profile_field) for profile in profiles
+                    ]
+            else:
+                columns[name] = [getattr(item, name) for item in items]
+        return columns
+
+
+# Validates a whole batch of raw metadata (e.g. a parsed JSON array) in one call.
+METADATA_LIST_ADAPTER: TypeAdapter[list[Metadata]] = TypeAdapter(list[Metadata])
@@ -3,7 +3,16 @@
 Utility functions package for QuackMetadata.
 """
 
-from quackmetadata.utils.prompt_engine import get_template_path, render_prompt
+from quackmetadata.utils.prompt_engine import (
+    get_template_path,
+    render_prompt,
+    render_prompt_parts,
+)
 from quackmetadata.utils.rarity import calculate_rarity
 
-__all__ = ["render_prompt", "get_template_path", "calculate_rarity"]
+__all__ = [
+    "render_prompt",
+    "render_prompt_parts",
+    "get_template_path",
+    "calculate_rarity",
+]
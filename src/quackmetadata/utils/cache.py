@@ -0,0 +1,245 @@
+# src/quackmetadata/utils/cache.py
+"""
+Result caching utilities for QuackMetadata.
+
+This module provides a small persistent cache for validated metadata so that
+documents that were already processed don't trigger another LLM call, and a
+cache of Google Drive downloads so unchanged files aren't fetched again.
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import closing
+
+from quackcore.fs.service import get_service
+from quackcore.logging import get_logger
+
+fs = get_service()
+logger = get_logger(__name__)
+
+
+def get_cache_dir() -> str:
+    """
+    Get the directory that holds QuackMetadata's caches.
+
+    Follows the XDG convention ($XDG_CACHE_HOME, defaulting to ~/.cache) so
+    cached results survive across projects and temp-directory cleanups,
+    falling back to the system temp directory if it can't be created.
+
+    Returns:
+        Path to the cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    cache_dir = str(fs.join_path(cache_home, "quackmetadata"))
+    result = fs.create_directory(cache_dir, exist_ok=True)
+    if not result.success:
+        logger.warning(f"Could not create cache directory {cache_dir}: {result.error}")
+        cache_dir = str(fs.join_path(tempfile.gettempdir(), "quackmetadata"))
+        fs.create_directory(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def get_default_cache_path() -> str:
+    """
+    Get the default location of the metadata cache database.
+
+    Returns:
+        Path to the SQLite cache file.
+    """
+    return str(fs.join_path(get_cache_dir(), "metadata_cache.sqlite"))
+
+
+class MetadataCache:
+    """
+    Persistent key-value cache of serialized metadata, backed by SQLite.
+
+    Cache failures are logged and never raised, so a broken cache only costs
+    an extra LLM call.
+    """
+
+    def __init__(self, db_path: str | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite file. Defaults to get_default_cache_path(),
+                resolved on first use.
+        """
+        self._db_path = db_path
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from the inputs that determine the extracted metadata.
+
+        Args:
+            *parts: Strings that identify the request (e.g. the rendered prompt).
+
+        Returns:
+            A 128-bit hex BLAKE2b digest of the parts.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection and make sure the cache table exists."""
+        if self._db_path is None:
+            self._db_path = get_default_cache_path()
+        conn = sqlite3.connect(self._db_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta_cache (key TEXT PRIMARY KEY, json TEXT)"
+        )
+        return conn
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached entry.
+
+        Args:
+            key: Cache key from make_key().
+
+        Returns:
+            The cached JSON string, or None on a miss.
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT json FROM meta_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Metadata cache lookup failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Store an entry in the cache.
+
+        Args:
+            key: Cache key from make_key().
+            value: JSON string to store.
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta_cache (key, json) VALUES (?, ?)",
+                    (key, value),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Metadata cache write failed: {e}")
+
+
+class DriveDownloadCache:
+    """
+    Local copies of Google Drive files, keyed by file ID and MD5 checksum.
+
+    Drive reports a new checksum whenever a file's content changes, so a copy
+    stored under the current checksum is always up to date. The least
+    recently used entries are evicted once the cache grows past its size limit.
+    """
+
+    def __init__(
+        self, cache_dir: str | None = None, max_bytes: int = 500 * 1024 * 1024
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached files. Defaults to a "drive"
+                directory under get_cache_dir(), resolved on first use.
+            max_bytes: Total size above which old entries are evicted.
+        """
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+
+    def _entry_dir(self, file_id: str, checksum: str) -> str:
+        """Get the directory for one version of a Drive file."""
+        if self._cache_dir is None:
+            self._cache_dir = str(fs.join_path(get_cache_dir(), "drive"))
+        return os.path.join(self._cache_dir, f"{file_id}-{checksum}")
+
+    def get(self, file_id: str, checksum: str, size: int | None = None) -> str | None:
+        """
+        Look up a cached copy of a Drive file.
+
+        Args:
+            file_id: Google Drive file ID.
+            checksum: The file's current md5Checksum.
+            size: Expected size in bytes, if known.
+
+        Returns:
+            Path to the cached copy, or None on a miss.
+        """
+        try:
+            with os.scandir(self._entry_dir(file_id, checksum)) as it:
+                entry = next((e for e in it if e.is_file()), None)
+            if entry is None:
+                return None
+            if size is not None and entry.stat().st_size != size:
+                return None
+            # Mark the entry as recently used for eviction.
+            os.utime(entry.path)
+        except OSError:
+            return None
+        return entry.path
+
+    def put(self, file_id: str, checksum: str, downloaded_path: str) -> str:
+        """
+        Move a freshly downloaded file into the cache.
+
+        Args:
+            file_id: Google Drive file ID.
+            checksum: The file's md5Checksum.
+            downloaded_path: Path of the completed download.
+
+        Returns:
+            Path to the cached copy, or downloaded_path if it couldn't be cached.
+        """
+        entry_dir = self._entry_dir(file_id, checksum)
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            cached_path = os.path.join(entry_dir, os.path.basename(downloaded_path))
+            shutil.move(downloaded_path, cached_path)
+        except OSError as e:
+            logger.warning(f"Could not cache Drive download: {e}")
+            return downloaded_path
+        self._prune(keep=entry_dir)
+        return cached_path
+
+    def _prune(self, keep: str) -> None:
+        """Evict the least recently used entries, except keep, until under the limit."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    size = 0
+                    last_used = 0.0
+                    with os.scandir(entry.path) as files:
+                        for f in files:
+                            st = f.stat()
+                            size += st.st_size
+                            last_used = max(last_used, st.st_mtime)
+                    entries.append((last_used, size, entry.path))
+                    total += size
+        except OSError as e:
+            logger.warning(f"Could not scan Drive download cache: {e}")
+            return
+
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
@@ -8,6 +8,7 @@ QuackCore Paths for configuration and file resolution when needed.
 """
 
 import os
+from functools import lru_cache
 from typing import Any
 
 # Import QuackCore FS and Paths.
@@ -51,36 +52,17 @@ def get_llm_integration(force_mock: bool = False) -> tuple[Any, bool]:
         logger.warning(
             "No LLM API keys found in environment. Attempting to load from configuration."
         )
-        # Use QuackCore Paths to resolve the configuration file relative to the project root.
-        config_file = paths.resolve_project_path("config/quack_config.yaml")
-        config_info = fs.get_file_info(str(config_file))
-        if config_info.success and config_info.exists:
-            config_result = fs.read_yaml(str(config_file))
-            if config_result.success:
-                config_data = config_result.data
-                # Attempt to load API keys from configuration and set them in the environment.
-                openai_key = (
-                    config_data.get("integrations", {})
-                    .get("llm", {})
-                    .get("openai", {})
-                    .get("api_key")
-                )
-                anthropic_key = (
-                    config_data.get("integrations", {})
-                    .get("llm", {})
-                    .get("anthropic", {})
-                    .get("api_key")
-                )
-                if openai_key:
-                    os.environ["OPENAI_API_KEY"] = openai_key
-                    has_openai_key = True
-                if anthropic_key:
-                    os.environ["ANTHROPIC_API_KEY"] = anthropic_key
-                    has_anthropic_key = True
-            else:
-                logger.error(
-                    f"Could not read configuration from {config_file}: {config_result.error}"
-                )
+        config_data = _load_project_config()
+        # Attempt to load API keys from configuration and set them in the environment.
+        llm_config = config_data.get("integrations", {}).get("llm", {})
+        openai_key = llm_config.get("openai", {}).get("api_key")
+        anthropic_key = llm_config.get("anthropic", {}).get("api_key")
+        if openai_key:
+            os.environ["OPENAI_API_KEY"] = openai_key
+            has_openai_key = True
+        if anthropic_key:
+            os.environ["ANTHROPIC_API_KEY"] = anthropic_key
+            has_anthropic_key = True
 
     if not (has_openai_key or has_anthropic_key):
         logger.warning(
@@ -109,6 +91,31 @@ def get_llm_integration(force_mock: bool = False) -> tuple[Any, bool]:
         return create_mock_llm(), True
 
 
+@lru_cache(maxsize=1)
+def _load_project_config() -> dict[str, Any]:
+    """
+    Load the project's config/quack_config.yaml.
+
+    The file is read once per process; environment variables are still
+    checked on every call to get_llm_integration().
+
+    Returns:
+        The parsed configuration, or an empty dict if it can't be read.
+    """
+    # Use QuackCore Paths to resolve the configuration file relative to the project root.
+    config_file = paths.resolve_project_path("config/quack_config.yaml")
+    config_info = fs.get_file_info(str(config_file))
+    if not (config_info.success and config_info.exists):
+        return {}
+    config_result = fs.read_yaml(str(config_file))
+    if not config_result.success:
+        logger.error(
+            f"Could not read configuration from {config_file}: {config_result.error}"
+        )
+        return {}
+    return config_result.data or {}
+
+
 def create_mock_llm() -> MockLLMClient:
     """
     Create a MockLLMClient with reasonable responses for testing.
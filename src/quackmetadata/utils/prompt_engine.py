@@ -6,10 +6,16 @@ This module provides functions for loading and rendering Mustache templates
 used for generating prompts for LLM interactions.
 """
 
+import os
 from collections.abc import Mapping
+from functools import lru_cache
+from importlib import resources
+from importlib.resources.abc import Traversable
 from pathlib import Path
 
 import pystache
+from pystache.context import KeyNotFoundError
+from pystache.parsed import ParsedTemplate
 
 # Import FS service and Paths service
 from quackcore.fs.service import get_service
@@ -19,6 +25,72 @@ from quackcore.paths import service as paths
 fs = get_service()
 logger = get_logger(__name__)
 
+# A single renderer is shared by all calls; templates are parsed once per file version.
+# Strict mode turns a tag with no value in the context into an error instead
+# of silently rendering it empty.
+_renderer = pystache.Renderer(missing_tags="strict")
+
+# Mustache comment separating the static instructions of a template from the
+# per-document part. Everything above it is identical across calls, so it is
+# sent as its own message where provider prompt caching can reuse it.
+CACHE_BOUNDARY = "{{! cache-boundary }}"
+
+
+@lru_cache(maxsize=32)
+def _load_parsed_template(
+    template_path: str, mtime_ns: int, size: int
+) -> tuple[ParsedTemplate | None, ParsedTemplate]:
+    """
+    Read and parse a Mustache template, split at the cache boundary.
+
+    The modification time and size are part of the cache key so edited
+    templates are picked up without restarting the process, even when an
+    edit lands within the filesystem's timestamp granularity.
+
+    Args:
+        template_path: Normalized path to the Mustache template file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        A tuple of the parsed static prefix (None if the template has no
+        cache boundary) and the parsed dynamic remainder.
+
+    Raises:
+        FileNotFoundError: If the template file can't be read.
+    """
+    # Templates are small, so one unbuffered read and decode is enough.
+    try:
+        source = Path(template_path).read_bytes().decode("utf-8")
+    except OSError as e:
+        raise FileNotFoundError(f"Failed to read template file: {e}") from e
+    if CACHE_BOUNDARY not in source:
+        return None, pystache.parse(source)
+
+    static_source, _, dynamic_source = source.partition(CACHE_BOUNDARY)
+    # Drop the newline after the marker, as Mustache does for standalone comments.
+    dynamic_source = dynamic_source.removeprefix("\n")
+    return pystache.parse(static_source), pystache.parse(dynamic_source)
+
+
+@lru_cache(maxsize=256)
+def _normalize_template_path(template_path: str, cwd: str) -> str:
+    """
+    Normalize a template path through the FS service.
+
+    Prompts are rendered from a handful of fixed paths, so the result is
+    memoized. The working directory is part of the key because relative
+    paths resolve against it.
+
+    Args:
+        template_path: Path to the Mustache template file.
+        cwd: Current working directory.
+
+    Returns:
+        The normalized path as a string.
+    """
+    return str(fs.normalize_path(template_path))
+
 
 def render_prompt(template_path: str, context: Mapping[str, str]) -> str:
     """
@@ -31,35 +103,59 @@ def render_prompt(template_path: str, context: Mapping[str, str]) -> str:
     Returns:
         The rendered prompt string.
 
+    Raises:
+        FileNotFoundError: If the template file doesn't exist.
+        ValueError: If the template is invalid or context is missing required values.
+    """
+    return "".join(render_prompt_parts(template_path, context))
+
+
+def render_prompt_parts(
+    template_path: str, context: Mapping[str, str]
+) -> tuple[str, str]:
+    """
+    Render a Mustache template as a static prefix and a dynamic suffix.
+
+    The template is split at CACHE_BOUNDARY. Templates without the marker
+    render entirely into the suffix and return an empty prefix.
+
+    Args:
+        template_path: Path to the Mustache template file.
+        context: Dictionary of context variables to render in the template.
+
+    Returns:
+        A tuple of (static_prefix, dynamic_suffix).
+
     Raises:
         FileNotFoundError: If the template file doesn't exist.
         ValueError: If the template is invalid or context is missing required values.
     """
     try:
         # Normalize and convert path to string.
-        template_path_str = str(fs.normalize_path(template_path))
-
-        # Use FS to check if the file exists.
-        file_info = fs.get_file_info(template_path_str)
-        if not file_info.success or not file_info.exists:
-            raise FileNotFoundError(f"Template file not found: {template_path_str}")
+        template_path_str = _normalize_template_path(template_path, os.getcwd())
 
-        # Read the file using FS.
-        read_result = fs.read_text(template_path_str, encoding="utf-8")
-        if not read_result.success:
+        # A single stat both checks existence and keys the parsed-template cache.
+        try:
+            st = os.stat(template_path_str)
+        except OSError as e:
             raise FileNotFoundError(
-                f"Failed to read template file: {read_result.error}"
-            )
+                f"Template file not found: {template_path_str}"
+            ) from e
 
-        template = read_result.content
-        rendered = pystache.render(template, context)
+        static_template, dynamic_template = _load_parsed_template(
+            template_path_str, st.st_mtime_ns, st.st_size
+        )
+        static_prefix = (
+            _renderer.render(static_template, context) if static_template else ""
+        )
+        dynamic_suffix = _renderer.render(dynamic_template, context)
         logger.debug(f"Successfully rendered template: {template_path_str}")
-        return rendered
+        return static_prefix, dynamic_suffix
 
     except FileNotFoundError as e:
         logger.error(f"Template file not found: {template_path_str}")
         raise e
-    except KeyError as e:
+    except (KeyError, KeyNotFoundError) as e:
         logger.error(f"Missing context key in template: {e}")
         raise ValueError(f"Missing required context key: {e}") from e
     except Exception as e:
@@ -71,6 +167,10 @@ def get_template_path(template_name: str, category: str = "metadata") -> str:
     """
     Get the path to a template by name and category.
 
+    Found templates are memoized, since resolving a template probes package
+    resources and the project tree. Misses are not, so templates added to
+    a running process are picked up.
+
     Args:
         template_name: Name of the template file (without .mustache extension).
         category: Category folder name (default: "metadata").
@@ -78,31 +178,75 @@ def get_template_path(template_name: str, category: str = "metadata") -> str:
     Returns:
         A string path to the template file.
     """
-    # Try to find templates in package resources.
     try:
-        from importlib import resources
+        return _find_template_path(template_name, category, os.getcwd())
+    except FileNotFoundError:
+        pass
+
+    # As a last resort, manually build a fallback path using the current module's directory.
+    current_file = Path(__file__)
+    current_dir = current_file.parent
+    default_path = os.fspath(
+        current_dir.parent / "prompts" / category / f"{template_name}.mustache"
+    )
+    logger.warning(
+        f"Could not find template: {template_name}. Using fallback path: {default_path}"
+    )
+    return default_path
 
+
+@lru_cache(maxsize=16)
+def _resource_roots(category: str) -> tuple[Traversable, ...]:
+    """
+    Get the package resource directories that may hold a category's templates.
+
+    Package lookup is done once per category. quacktool's prompts take
+    precedence over the bundled quackmetadata prompts when both are installed.
+
+    Args:
+        category: Category folder name.
+
+    Returns:
+        The resource directories of the packages that could be imported.
+    """
+    roots = []
+    for package in (
+        f"quacktool.prompts.{category}",
+        f"quackmetadata.prompts.{category}",
+    ):
         try:
-            # First try with quacktool.prompts
-            with resources.files(f"quacktool.prompts.{category}") as pkg_path:
-                template_path = pkg_path / f"{template_name}.mustache"
-                template_path_str = str(template_path)
-                file_info = fs.get_file_info(template_path_str)
-                if file_info.success and file_info.exists:
-                    return template_path_str
-        except (ImportError, ModuleNotFoundError):
-            # Then try with quackmetadata.prompts
-            try:
-                with resources.files(f"quackmetadata.prompts.{category}") as pkg_path:
-                    template_path = pkg_path / f"{template_name}.mustache"
-                    template_path_str = str(template_path)
-                    file_info = fs.get_file_info(template_path_str)
-                    if file_info.success and file_info.exists:
-                        return template_path_str
-            except (ImportError, ModuleNotFoundError):
-                pass
-    except (ImportError, ModuleNotFoundError):
-        pass
+            roots.append(resources.files(package))
+        except ImportError:
+            continue
+    return tuple(roots)
+
+
+@lru_cache(maxsize=256)
+def _find_template_path(template_name: str, category: str, cwd: str) -> str:
+    """
+    Resolve a template path by probing the filesystem.
+
+    Candidates are probed with os.path.isfile, a single stat, since only
+    their existence matters here. The working directory is part of the
+    cache key because the project root is detected from it.
+
+    Args:
+        template_name: Name of the template file (without .mustache extension).
+        category: Category folder name.
+        cwd: Current working directory.
+
+    Returns:
+        A string path to the template file.
+
+    Raises:
+        FileNotFoundError: If no candidate exists. Exceptions aren't cached,
+            so a miss is probed again on the next call.
+    """
+    # Try to find templates in package resources.
+    for root in _resource_roots(category):
+        template_path_str = str(root / f"{template_name}.mustache")
+        if os.path.isfile(template_path_str):
+            return template_path_str
 
     # Fallback: Attempt to resolve template path relative to project structure.
     fallback_candidates = [
@@ -113,17 +257,7 @@ def get_template_path(template_name: str, category: str = "metadata") -> str:
         # Use the Paths to resolve candidate paths relative to the project root.
         candidate_path = paths.resolve_project_path(candidate)
         candidate_str = str(candidate_path)
-        file_info = fs.get_file_info(candidate_str)
-        if file_info.success and file_info.exists:
+        if os.path.isfile(candidate_str):
             return candidate_str
 
-    # As a last resort, manually build a fallback path using the current module's directory.
-    current_file = Path(__file__)
-    current_dir = current_file.parent
-    default_path = str(
-        current_dir.parent / "prompts" / category / f"{template_name}.mustache"
-    )
-    logger.warning(
-        f"Could not find template: {template_name}. Using fallback path: {default_path}"
-    )
-    return default_path
+    raise FileNotFoundError(f"Template not found: {category}/{template_name}")
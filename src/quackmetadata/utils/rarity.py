@@ -6,12 +6,48 @@ This module provides functions for determining the rarity of documents
 based on content analysis.
 """
 
+import re
+from functools import lru_cache
 
+_LEGENDARY_TERMS = frozenset(
+    {
+        "groundbreaking",
+        "revolutionary",
+        "unprecedented",
+        "extraordinary",
+        "remarkable",
+        "absurd",
+        "paradoxical",
+    }
+)
+
+_RARE_TERMS = frozenset(
+    {
+        "innovative",
+        "unique",
+        "uncommon",
+        "unusual",
+        "specialized",
+        "technical",
+        "complex",
+    }
+)
+
+# Finds every term in a single scan. The lookahead matches at each position,
+# so terms that overlap in the text are all found, as with separate `in` tests.
+_RARITY_TERMS = re.compile(
+    "(?=({}))".format("|".join(map(re.escape, _LEGENDARY_TERMS | _RARE_TERMS))),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=256)
 def calculate_rarity(summary: str) -> str:
     """
     Calculate the rarity of a document based on its summary.
 
     Uses heuristics to determine if a document is common, rare, or legendary.
+    The result depends only on the summary, so recent results are memoized.
 
     Args:
         summary: The document summary text
@@ -23,34 +59,14 @@ def calculate_rarity(summary: str) -> str:
     if not summary:
         return "🟢 Common"
 
-    summary_lower = summary.lower()
+    hits = {match.group(1).lower() for match in _RARITY_TERMS.finditer(summary)}
 
     # Legendary criteria
-    legendary_terms = [
-        "groundbreaking",
-        "revolutionary",
-        "unprecedented",
-        "extraordinary",
-        "remarkable",
-        "absurd",
-        "paradoxical",
-    ]
-
-    if len(summary) > 500 and any(term in summary_lower for term in legendary_terms):
+    if len(summary) > 500 and not hits.isdisjoint(_LEGENDARY_TERMS):
         return "🟣 Legendary"
 
     # Rare criteria
-    rare_terms = [
-        "innovative",
-        "unique",
-        "uncommon",
-        "unusual",
-        "specialized",
-        "technical",
-        "complex",
-    ]
-
-    if len(summary) > 300 or any(term in summary_lower for term in rare_terms):
+    if len(summary) > 300 or not hits.isdisjoint(_RARE_TERMS):
         return "🔴 Rare"
 
     # Default to common
@@ -0,0 +1,134 @@
+# src/quackmetadata/utils/truncation.py
+"""
+Content truncation utilities for QuackMetadata.
+
+This module provides functions for fitting document content into an LLM
+context window before it is rendered into a prompt.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from quackcore.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default input budget for a metadata prompt. Metadata can be inferred from an
+# excerpt, so this is well below the context window of current models.
+DEFAULT_MAX_INPUT_TOKENS = 16000
+
+TRUNCATION_MARKER = "\n\n[... content truncated ...]\n\n"
+
+# Rough characters-per-token ratio used when no tokenizer is available.
+_CHARS_PER_TOKEN = 4
+
+# Share of the budget kept from the start of the document; the rest is
+# taken from the end, where conclusions and signatures usually are.
+_HEAD_RATIO = 2 / 3
+
+# Tokens rarely span more characters than this. Content longer than this
+# many characters per token of budget is cut down before tokenizing, so a
+# huge document costs no more to truncate than one slightly over budget.
+_MAX_CHARS_PER_TOKEN = 16
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str | None) -> Any:
+    """
+    Get the tiktoken encoding for a model.
+
+    Args:
+        model: Model name, or None for the default encoding.
+
+    Returns:
+        A tiktoken Encoding, or None if tiktoken or its data is unavailable.
+    """
+    try:
+        import tiktoken
+
+        if model:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                pass
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.debug(f"Falling back to character-based token estimates: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """
+    Count the tokens in a text.
+
+    Args:
+        text: Text to measure.
+        model: Model whose tokenizer should be used.
+
+    Returns:
+        The token count, estimated from the length if no tokenizer is available.
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_content(content: str, max_tokens: int, model: str | None = None) -> str:
+    """
+    Truncate content to a token budget, keeping its head and tail.
+
+    Args:
+        content: Document content.
+        max_tokens: Maximum number of tokens to keep.
+        model: Model whose tokenizer should be used.
+
+    Returns:
+        The content unchanged if it fits, otherwise its head and tail joined
+        by TRUNCATION_MARKER.
+    """
+    max_tokens = max(max_tokens, 0)
+    # A token always covers at least one byte, so short content fits as-is.
+    if len(content) <= max_tokens and content.isascii():
+        return content
+
+    encoding = _get_encoding(model)
+    if encoding is None:
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        if len(content) <= max_chars:
+            return content
+        head_chars = int(max_chars * _HEAD_RATIO)
+        tail_chars = max_chars - head_chars
+        tail = content[-tail_chars:] if tail_chars else ""
+        return content[:head_chars] + TRUNCATION_MARKER + tail
+
+    head_tokens = int(max_tokens * _HEAD_RATIO)
+    tail_tokens = max_tokens - head_tokens
+
+    scan_chars = max_tokens * _MAX_CHARS_PER_TOKEN
+    if len(content) > scan_chars:
+        # Only the ends of the document can survive, so tokenize just those.
+        head_scan = int(scan_chars * _HEAD_RATIO)
+        tail_scan = scan_chars - head_scan
+        head = encoding.encode(content[:head_scan], disallowed_special=())
+        tail = (
+            encoding.encode(content[-tail_scan:], disallowed_special=())
+            if tail_scan
+            else []
+        )
+        logger.info(
+            f"Truncated content from {len(content)} characters to {max_tokens} tokens"
+        )
+        return (
+            encoding.decode(head[:head_tokens])
+            + TRUNCATION_MARKER
+            + (encoding.decode(tail[-tail_tokens:]) if tail_tokens else "")
+        )
+
+    tokens = encoding.encode(content, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return content
+
+    tail = encoding.decode(tokens[-tail_tokens:]) if tail_tokens else ""
+    logger.info(f"Truncated content from {len(tokens)} to {max_tokens} tokens")
+    return encoding.decode(tokens[:head_tokens]) + TRUNCATION_MARKER + tail
@@ -0,0 +1,128 @@
+# tests/conftest.py
+"""
+Shared fixtures for the QuackMetadata tests.
+"""
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from quackcore.integrations.core.results import IntegrationResult
+
+from quackmetadata.plugins.metadata import MetadataPlugin
+
+_ROW = re.compile(r"^---ROW (\d+)---\n(.*?)\n(?=---ROW |---END---)", re.M | re.S)
+
+
+def make_metadata(title: str) -> dict[str, Any]:
+    """
+    Build a valid metadata response for a document.
+
+    Args:
+        title: Title to report, used by tests to tell documents apart.
+
+    Returns:
+        A dictionary matching the Metadata schema.
+    """
+    return {
+        "title": title,
+        "summary": f"A short summary of {title}.",
+        "author_style": "concise",
+        "tone": "neutral",
+        "language": "English",
+        "domain": "testing",
+        "estimated_date": None,
+        "rarity": "🟢 Common",
+        "author_profile": {
+            "name": "Ada Tester",
+            "profession": "Engineer",
+            "writing_style": "plain",
+            "possible_age_range": "30-40",
+            "location_guess": "Nowhere",
+        },
+    }
+
+
+def batch_rows(prompt: str) -> list[tuple[int, str]]:
+    """
+    Parse the rows of a rendered batch prompt.
+
+    Args:
+        prompt: The user message of a batch request.
+
+    Returns:
+        (row, content) tuples in prompt order.
+    """
+    return [(int(row), content) for row, content in _ROW.findall(prompt)]
+
+
+def default_response(messages: list[Any]) -> str:
+    """
+    Answer a request with metadata titled after each document's first line.
+
+    Args:
+        messages: Messages of the chat request.
+
+    Returns:
+        A JSON response; a "results" array for batch requests.
+    """
+    prompt = messages[-1].content
+    rows = batch_rows(prompt)
+    if rows:
+        return json.dumps(
+            {
+                "results": [
+                    {"row": row, **make_metadata(content.splitlines()[0])}
+                    for row, content in rows
+                ]
+            }
+        )
+    document = prompt.split("---", 2)[1].strip() if "---" in prompt else prompt
+    return json.dumps(make_metadata(document.splitlines()[0]))
+
+
+class FakeLLMClient:
+    """LLM client that answers from a function and records every request."""
+
+    def __init__(self, respond: Callable[[list[Any]], str] = default_response):
+        self.respond = respond
+        self.requests: list[list[Any]] = []
+
+    def chat(self, messages: list[Any], options: Any = None) -> IntegrationResult:
+        self.requests.append(messages)
+        return IntegrationResult.success_result(content=self.respond(messages))
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the persistent caches of each test in its own directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def llm() -> FakeLLMClient:
+    return FakeLLMClient()
+
+
+@pytest.fixture
+def plugin(llm) -> MetadataPlugin:
+    """A MetadataPlugin that sends its requests to the fake LLM client."""
+    plugin = MetadataPlugin()
+    plugin._llm_service = llm
+    plugin._initialized = True
+    return plugin
+
+
+@pytest.fixture
+def documents(tmp_path) -> list[str]:
+    """Paths of three small text files whose first lines name them."""
+    paths = []
+    for name in ("alpha", "beta", "gamma"):
+        path = tmp_path / f"{name}.txt"
+        path.write_text(f"{name}\nThe body of the {name} document.\n")
+        paths.append(str(path))
+    return paths
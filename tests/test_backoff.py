@@ -0,0 +1,62 @@
+# tests/test_backoff.py
+"""
+Tests for the retry delays between LLM attempts.
+"""
+
+import pytest
+
+from quackmetadata.plugins.metadata import (
+    _BACKOFF_MAX_SECONDS,
+    _RATE_LIMIT_BACKOFF_MAX_SECONDS,
+    _RETRY_AFTER,
+    _compute_backoff,
+)
+
+
+@pytest.mark.parametrize(
+    ("message", "seconds"),
+    [
+        ("429 Too Many Requests. Retry-After: 7", "7"),
+        ("rate limited, retry after 2.5 seconds", "2.5"),
+        ("Please retry_after=3s", "3"),
+        ("retry-after 12 sec", "12"),
+        ("RETRY AFTER: 4", "4"),
+    ],
+)
+def test_retry_after_is_parsed_in_seconds(message, seconds):
+    match = _RETRY_AFTER.search(message)
+    assert match is not None
+    assert match.group(1) == seconds
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "retry after 5 minutes",
+        "retry after 500ms",
+        "retry after 1.2.3",
+        "server error 500",
+    ],
+)
+def test_retry_after_ignores_other_units(message):
+    assert _RETRY_AFTER.search(message) is None
+
+
+def test_retry_after_takes_precedence():
+    assert _compute_backoff(0, "429 rate limit, retry-after: 3") == 3.0
+
+
+def test_retry_after_is_capped():
+    delay = _compute_backoff(0, "retry-after: 3600")
+    assert delay == _RATE_LIMIT_BACKOFF_MAX_SECONDS
+
+
+def test_backoff_grows_and_is_capped():
+    for attempt in range(10):
+        delay = _compute_backoff(attempt, "connection reset")
+        assert 0 < delay <= _BACKOFF_MAX_SECONDS + 1
+
+
+def test_rate_limits_wait_longer_than_parse_errors():
+    assert _compute_backoff(0, "429 Too Many Requests") >= 1.0
+    assert _compute_backoff(0) < 1.0
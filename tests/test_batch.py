@@ -0,0 +1,118 @@
+# tests/test_batch.py
+"""
+Tests for batched metadata extraction in MetadataPlugin.process_files.
+"""
+
+import json
+
+import pytest
+from conftest import batch_rows, default_response, make_metadata
+
+from quackmetadata.plugins.metadata import _order_batch_rows
+
+
+def _titles(results):
+    return [result.content["metadata"]["title"] for result in results]
+
+
+def _outputs(tmp_path, count):
+    return [str(tmp_path / f"out{i}.json") for i in range(count)]
+
+
+def test_order_batch_rows_sorts_results_by_row():
+    items = [{"row": 2, "title": "b"}, {"row": 3, "title": "c"}, {"row": 1}]
+    assert [item["row"] for item in _order_batch_rows(items, 3)] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [{"row": 1}, {"row": 1}],
+        [{"row": 1}],
+        [{"row": 1}, {"row": 2}, {"row": 3}],
+        [{"row": 0}, {"row": 1}],
+        [{"row": True}, {"row": 2}],
+        [{"row": "1"}, {"row": 2}],
+        [{"title": "no row"}, {"row": 2}],
+        {"row": 1},
+    ],
+)
+def test_order_batch_rows_rejects_rows_that_dont_match(items):
+    with pytest.raises(ValueError):
+        _order_batch_rows(items, 2)
+
+
+def test_batch_results_are_aligned_by_row(plugin, llm, documents, tmp_path):
+    def reversed_rows(messages):
+        rows = batch_rows(messages[-1].content)
+        results = [
+            {"row": row, **make_metadata(content.splitlines()[0])}
+            for row, content in reversed(rows)
+        ]
+        return json.dumps({"results": results})
+
+    llm.respond = reversed_rows
+    results = plugin.process_files(
+        documents, _outputs(tmp_path, 3), options={"batch_size": 3}
+    )
+
+    assert len(llm.requests) == 1
+    assert all(result.success for result in results)
+    assert _titles(results) == ["alpha", "beta", "gamma"]
+
+
+def test_batch_with_mismatched_rows_falls_back_to_single_requests(
+    plugin, llm, documents, tmp_path
+):
+    def duplicate_rows(messages):
+        rows = batch_rows(messages[-1].content)
+        if not rows:
+            return default_response(messages)
+        results = [{"row": 1, **make_metadata("wrong")} for _ in rows]
+        return json.dumps({"results": results})
+
+    llm.respond = duplicate_rows
+    results = plugin.process_files(
+        documents, _outputs(tmp_path, 3), options={"batch_size": 3}
+    )
+
+    assert len(llm.requests) == 1 + len(documents)
+    assert all(result.success for result in results)
+    assert "wrong" not in _titles(results)
+
+
+def test_custom_prompt_template_disables_batching(plugin, llm, documents, tmp_path):
+    template = tmp_path / "custom.mustache"
+    template.write_text("Describe this document as JSON.\n---\n{{content}}\n---\n")
+
+    results = plugin.process_files(
+        documents,
+        _outputs(tmp_path, 3),
+        options={"batch_size": 3, "prompt_template": str(template)},
+    )
+
+    assert all(result.success for result in results)
+    assert len(llm.requests) == len(documents)
+    assert all(not batch_rows(request[-1].content) for request in llm.requests)
+
+
+@pytest.mark.parametrize("batch_size", [None, "many", 0, 1])
+def test_invalid_or_unit_batch_size_processes_files_one_by_one(
+    plugin, llm, documents, tmp_path, batch_size
+):
+    results = plugin.process_files(
+        documents, _outputs(tmp_path, 3), options={"batch_size": batch_size}
+    )
+
+    assert all(result.success for result in results)
+    assert len(llm.requests) == len(documents)
+    assert _titles(results) == ["alpha", "beta", "gamma"]
+
+
+def test_string_batch_size_is_coerced(plugin, llm, documents, tmp_path):
+    results = plugin.process_files(
+        documents, _outputs(tmp_path, 3), options={"batch_size": "3"}
+    )
+
+    assert len(llm.requests) == 1
+    assert _titles(results) == ["alpha", "beta", "gamma"]
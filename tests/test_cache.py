@@ -0,0 +1,140 @@
+# tests/test_cache.py
+"""
+Tests for the metadata cache and the Google Drive download cache.
+"""
+
+import hashlib
+import os
+
+from quackcore.integrations.core.results import IntegrationResult
+
+from quackmetadata.utils.cache import DriveDownloadCache, MetadataCache
+
+_FILE_ID = "A" * 28
+
+
+def test_metadata_cache_round_trip(tmp_path):
+    cache = MetadataCache(str(tmp_path / "metadata.sqlite"))
+    key = MetadataCache.make_key("template", "content")
+
+    assert cache.get(key) is None
+    cache.put(key, '{"title": "cached"}')
+    assert cache.get(key) == '{"title": "cached"}'
+    assert MetadataCache.make_key("template", "content") == key
+    assert MetadataCache.make_key("templatec", "ontent") != key
+
+
+def test_repeated_document_is_served_from_cache(plugin, llm):
+    first = plugin._extract_metadata("alpha\nSome text.", {})
+    second = plugin._extract_metadata("alpha\nSome text.", {})
+
+    assert first.success and second.success
+    assert len(llm.requests) == 1
+    assert second.message == "Loaded metadata from cache"
+    assert second.content == first.content
+
+
+def test_changed_document_misses_cache(plugin, llm):
+    plugin._extract_metadata("alpha\nSome text.", {})
+    plugin._extract_metadata("alpha\nOther text.", {})
+
+    assert len(llm.requests) == 2
+
+
+def test_cache_off_always_calls_llm(plugin, llm):
+    for _ in range(3):
+        result = plugin._extract_metadata("alpha\nSome text.", {"cache": "off"})
+        assert result.success
+
+    assert len(llm.requests) == 3
+
+
+def _download(directory, name, data):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def test_drive_cache_hit_returns_stored_copy(tmp_path):
+    cache = DriveDownloadCache(str(tmp_path / "drive"))
+    downloaded = _download(tmp_path / "dl", "report.txt", b"report")
+
+    cached = cache.put(_FILE_ID, "sum1", downloaded)
+
+    assert not os.path.exists(downloaded)
+    assert cache.get(_FILE_ID, "sum1", size=6) == cached
+    with open(cached, "rb") as f:
+        assert f.read() == b"report"
+
+
+def test_drive_cache_misses_on_other_checksum_or_size(tmp_path):
+    cache = DriveDownloadCache(str(tmp_path / "drive"))
+    cache.put(_FILE_ID, "sum1", _download(tmp_path / "dl", "report.txt", b"report"))
+
+    assert cache.get(_FILE_ID, "sum2") is None
+    assert cache.get(_FILE_ID, "sum1", size=7) is None
+    assert cache.get("B" * 28, "sum1") is None
+
+
+def test_drive_cache_evicts_least_recently_used(tmp_path):
+    cache = DriveDownloadCache(str(tmp_path / "drive"), max_bytes=10)
+    old = cache.put("old", "sum", _download(tmp_path / "dl1", "a.txt", b"x" * 6))
+    os.utime(old, (1, 1))
+    new = cache.put("new", "sum", _download(tmp_path / "dl2", "b.txt", b"y" * 6))
+
+    assert cache.get("old", "sum") is None
+    assert cache.get("new", "sum") == new
+
+
+class _FakeDrive:
+    """Drive service serving one file, with a configurable reported checksum."""
+
+    def __init__(self, data, checksum=None):
+        self.data = data
+        self.checksum = checksum
+        self.calls = []
+
+    def get_file_info(self, remote_id):
+        self.calls.append("get_file_info")
+        info = {"id": remote_id, "name": "report.txt", "size": str(len(self.data))}
+        if self.checksum:
+            info["md5Checksum"] = self.checksum
+        return IntegrationResult.success_result(content=info)
+
+    def download_file(self, remote_id, local_path):
+        self.calls.append("download_file")
+        return IntegrationResult.success_result(
+            content=_download(local_path, "report.txt", self.data)
+        )
+
+
+def test_drive_fetch_reuses_cached_download(plugin):
+    drive = _FakeDrive(b"report", hashlib.md5(b"report").hexdigest())
+
+    first = plugin._fetch_drive_file_cached(drive, _FILE_ID)
+    second = plugin._fetch_drive_file_cached(drive, _FILE_ID)
+
+    assert first.success and second.success
+    assert first.content[0] == second.content[0]
+    assert drive.calls == ["get_file_info", "download_file", "get_file_info"]
+
+
+def test_drive_fetch_doesnt_cache_checksum_mismatch(plugin):
+    drive = _FakeDrive(b"report", hashlib.md5(b"changed").hexdigest())
+
+    result = plugin._fetch_drive_file_cached(drive, _FILE_ID)
+
+    assert result.success
+    assert plugin._download_cache.get(_FILE_ID, drive.checksum) is None
+
+
+def test_drive_fetch_without_checksum_fetches_info_once(plugin):
+    drive = _FakeDrive(b"native document")
+
+    result = plugin._fetch_drive_file_cached(drive, _FILE_ID)
+
+    assert result.success
+    assert result.content[1]["name"] == "report.txt"
+    assert drive.calls == ["get_file_info", "download_file"]
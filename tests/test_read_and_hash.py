@@ -0,0 +1,74 @@
+# tests/test_read_and_hash.py
+"""
+Tests for reading and hashing local files in one pass.
+"""
+
+import hashlib
+
+import pytest
+
+from quackmetadata.plugins import metadata
+from quackmetadata.plugins.metadata import _read_and_hash
+
+_TEXT = "Café — naïve résumé. " * 5000
+
+
+@pytest.fixture(params=["chunked", "mmap"])
+def read_path(request, monkeypatch):
+    """Run a test with small reads and with memory-mapped reads."""
+    if request.param == "chunked":
+        monkeypatch.setattr(metadata, "_READ_CHUNK_SIZE", 7)
+        monkeypatch.setattr(metadata, "_MMAP_THRESHOLD", 1 << 30)
+    else:
+        monkeypatch.setattr(metadata, "_MMAP_THRESHOLD", 1)
+    return request.param
+
+
+def test_reads_and_hashes_whole_file(tmp_path, read_path):
+    data = _TEXT.encode("utf-8")
+    path = tmp_path / "doc.txt"
+    path.write_bytes(data)
+
+    content, digest = _read_and_hash(str(path))
+
+    assert content == _TEXT
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def test_max_bytes_drops_a_split_character(tmp_path, read_path):
+    data = "ab€".encode()
+    path = tmp_path / "doc.txt"
+    path.write_bytes(data)
+
+    content, digest = _read_and_hash(str(path), max_bytes=4)
+
+    assert content == "ab"
+    assert digest == hashlib.sha256(data[:4]).hexdigest()
+
+
+def test_invalid_utf8_is_replaced(tmp_path, read_path):
+    data = b"ok \xff\xfe done"
+    path = tmp_path / "doc.txt"
+    path.write_bytes(data)
+
+    content, digest = _read_and_hash(str(path))
+
+    assert content == "ok �� done"
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def test_empty_file(tmp_path, read_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(b"")
+
+    assert _read_and_hash(str(path)) == ("", hashlib.sha256(b"").hexdigest())
+
+
+def test_rejects_files_over_the_size_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata, "_MAX_FILE_BYTES", 4)
+    path = tmp_path / "doc.txt"
+    path.write_bytes(b"too large")
+
+    with pytest.raises(ValueError):
+        _read_and_hash(str(path))
+    assert _read_and_hash(str(path), max_bytes=3)[0] == "too"
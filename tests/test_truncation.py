@@ -0,0 +1,89 @@
+# tests/test_truncation.py
+"""
+Tests for fitting document content into a token budget.
+"""
+
+import pytest
+
+from quackmetadata.utils import truncation
+from quackmetadata.utils.truncation import (
+    _MAX_CHARS_PER_TOKEN,
+    TRUNCATION_MARKER,
+    count_tokens,
+    truncate_content,
+)
+
+
+class _CharEncoding:
+    """Tokenizer with one token per character that records what it encodes."""
+
+    def __init__(self):
+        self.encoded_lengths = []
+
+    def encode(self, text, disallowed_special=()):
+        self.encoded_lengths.append(len(text))
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+@pytest.fixture
+def encoding(monkeypatch):
+    encoding = _CharEncoding()
+    monkeypatch.setattr(truncation, "_get_encoding", lambda model: encoding)
+    return encoding
+
+
+@pytest.fixture
+def no_tokenizer(monkeypatch):
+    monkeypatch.setattr(truncation, "_get_encoding", lambda model: None)
+
+
+def test_content_within_budget_is_unchanged(encoding):
+    assert truncate_content("short text", 100) == "short text"
+    assert truncate_content("x" * 100, 100) == "x" * 100
+
+
+def test_truncation_keeps_head_and_tail(encoding):
+    content = "H" * 300 + "M" * 400 + "T" * 300
+
+    result = truncate_content(content, 300)
+
+    head, tail = result.split(TRUNCATION_MARKER)
+    assert head == "H" * 200
+    assert tail == "T" * 100
+    assert encoding.encoded_lengths == [len(content)]
+
+
+def test_scan_path_only_tokenizes_the_ends(encoding):
+    max_tokens = 30
+    content = "H" * 1000 + "M" * 100_000 + "T" * 1000
+
+    result = truncate_content(content, max_tokens)
+
+    head, tail = result.split(TRUNCATION_MARKER)
+    assert head == "H" * 20
+    assert tail == "T" * 10
+    assert sum(encoding.encoded_lengths) == max_tokens * _MAX_CHARS_PER_TOKEN
+
+
+def test_zero_budget_keeps_nothing(encoding):
+    assert truncate_content("some content", 0) == TRUNCATION_MARKER
+
+
+def test_fallback_without_tokenizer_uses_character_estimate(no_tokenizer):
+    content = "H" * 400 + "M" * 400 + "T" * 400
+
+    result = truncate_content(content, 150)
+
+    head, tail = result.split(TRUNCATION_MARKER)
+    assert head == "H" * 400
+    assert tail == "T" * 200
+    assert truncate_content("x" * 600, 150) == "x" * 600
+
+
+def test_count_tokens_fallback_rounds_up(no_tokenizer):
+    assert count_tokens("") == 0
+    assert count_tokens("abcd") == 1
+    assert count_tokens("abcde") == 2